@@ -262,6 +262,19 @@ class ProjectConfig:
         settings = config.get("settings", {})
         return settings.get("log_activity", True)
 
+    def get_log_render_batch(self) -> int:
+        """Get how many unrendered activity entries trigger an HTML log rebuild.
+
+        Returns:
+            Entry count from settings.log_render_batch, defaulting to 50
+        """
+        config = self.load()
+        settings = config.get("settings", {})
+        try:
+            return max(1, int(settings.get("log_render_batch", 50)))
+        except (TypeError, ValueError):
+            return 50
+
     def get_activity_log_file(self) -> str:
         """Get the configured activity log file name.
 
@@ -16,6 +16,22 @@ from typing import Dict, Iterator, List, Optional, Tuple
 
 LOCK_FILENAME = ".edit.lock"
 MANIFEST_FILENAME = "history.jsonl"
+OPEN_BOOK_CACHE_SECONDS = 2.0
+
+# Cached xlwings module (None until probed; False when unavailable)
+_xlwings_module = None
+
+
+def _get_xlwings():
+    """Return xlwings module, probing the import only once per process."""
+    global _xlwings_module
+    if _xlwings_module is None:
+        try:
+            import xlwings as xw
+            _xlwings_module = xw
+        except Exception:
+            _xlwings_module = False
+    return _xlwings_module or None
 
 
 def _utc_now_iso() -> str:
@@ -35,6 +51,21 @@ def _file_sha256(path: Path) -> str:
     return hasher.hexdigest()
 
 
+def _atomic_copy(source: Path, destination: Path) -> None:
+    """Copy file to destination so it only appears once fully written."""
+    tmp_path = destination.with_name(f".{destination.name}.{uuid.uuid4().hex[:8]}.tmp")
+    try:
+        with open(source, "rb") as src, open(tmp_path, "wb") as dst:
+            shutil.copyfileobj(src, dst, 1024 * 1024)
+            dst.flush()
+            os.fsync(dst.fileno())
+        shutil.copystat(source, tmp_path)
+        os.replace(tmp_path, destination)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
 def _normalized_path(path: Path) -> str:
     """Normalize path for robust comparisons."""
     return str(path.resolve()).lower()
@@ -50,6 +81,15 @@ class WorkbookHistoryManager:
         self.snapshots_dir = self.history_dir / "snapshots"
         self.manifest_path = self.history_dir / MANIFEST_FILENAME
         self.lock_path = self.history_dir / LOCK_FILENAME
+        self._workbook_repr = self._rel(self.xlsform_path)
+        self._open_book_cache: Optional[Tuple[float, Optional[Tuple[object, object]]]] = None
+
+    def _rel(self, path: Path) -> str:
+        """Return path relative to the project directory when possible."""
+        try:
+            return str(path.relative_to(self.project_dir))
+        except ValueError:
+            return str(path)
 
     def ensure_dirs(self) -> None:
         """Create history directories if needed."""
@@ -64,21 +104,28 @@ class WorkbookHistoryManager:
             "file": str(self.xlsform_path),
             "timestamp": _utc_now_iso(),
         }
-        body = json.dumps(payload, ensure_ascii=True)
+        body = json.dumps(payload, ensure_ascii=True).encode("utf-8")
+        lock_path = str(self.lock_path)
+        retried_after_release = False
 
         while True:
             try:
-                fd = os.open(str(self.lock_path), os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
                 try:
-                    os.write(fd, body.encode("utf-8"))
+                    os.write(fd, body)
                 finally:
                     os.close(fd)
                 return
             except FileExistsError:
                 if time.time() - started >= timeout_seconds:
-                    details = ""
                     try:
                         details = self.lock_path.read_text(encoding="utf-8")
+                    except FileNotFoundError:
+                        # Holder released the lock between our open and read; try once more.
+                        if not retried_after_release:
+                            retried_after_release = True
+                            continue
+                        details = "<lock released during timeout>"
                     except Exception:
                         details = "<unreadable lock details>"
                     raise TimeoutError(
@@ -144,11 +191,20 @@ class WorkbookHistoryManager:
 
     def _find_open_excel_book(self) -> Optional[Tuple[object, object]]:
         """Try to find an open Excel workbook matching target file using xlwings."""
-        try:
-            import xlwings as xw
-        except Exception:
+        xw = _get_xlwings()
+        if xw is None:
             return None
 
+        now = time.monotonic()
+        if self._open_book_cache and now - self._open_book_cache[0] < OPEN_BOOK_CACHE_SECONDS:
+            return self._open_book_cache[1]
+
+        result = self._scan_open_excel_books(xw)
+        self._open_book_cache = (now, result)
+        return result
+
+    def _scan_open_excel_books(self, xw) -> Optional[Tuple[object, object]]:
+        """Enumerate running Excel instances for the target workbook."""
         target = _normalized_path(self.xlsform_path)
         try:
             for app in xw.apps:
@@ -174,7 +230,7 @@ class WorkbookHistoryManager:
             book.api.SaveCopyAs(str(destination))
             return "excel_savecopyas"
 
-        shutil.copy2(self.xlsform_path, destination)
+        _atomic_copy(self.xlsform_path, destination)
         return "copy2"
 
     def create_snapshot(
@@ -207,12 +263,8 @@ class WorkbookHistoryManager:
             "details": details,
             "command": command,
             "agent": agent,
-            "workbook": str(self.xlsform_path.relative_to(self.project_dir))
-            if self.xlsform_path.is_relative_to(self.project_dir)
-            else str(self.xlsform_path),
-            "snapshot_path": str(snapshot_path.relative_to(self.project_dir))
-            if snapshot_path.is_relative_to(self.project_dir)
-            else str(snapshot_path),
+            "workbook": self._workbook_repr,
+            "snapshot_path": self._rel(snapshot_path),
             "source_sha256": source_hash,
             "snapshot_sha256": snapshot_hash,
             "method": method,
@@ -228,9 +280,7 @@ class WorkbookHistoryManager:
             "action_type": action_type,
             "description": description,
             "details": details,
-            "workbook": str(self.xlsform_path.relative_to(self.project_dir))
-            if self.xlsform_path.is_relative_to(self.project_dir)
-            else str(self.xlsform_path),
+            "workbook": self._workbook_repr,
         }
         if extra:
             record.update(extra)
@@ -271,6 +321,7 @@ class WorkbookHistoryManager:
         if open_book:
             app, book = open_book
             book.api.Close(False)
+            self._open_book_cache = None
             shutil.copy2(snapshot_path, self.xlsform_path)
             app.books.open(str(self.xlsform_path))
             method = "close_copy_reopen"
@@ -1,11 +1,11 @@
 """XLSForm AI Knowledge Base - RAG-powered best practices system."""
 
-__all__ = ["RAGEngine", "SentenceTransformerEmbedder", "FAISSRetriever"]
+__all__ = ["RAGEngine", "SentenceTransformerEmbedder", "FAISSRetriever", "USearchRetriever"]
 
 try:
     from .rag_engine import RAGEngine
     from .embedder import SentenceTransformerEmbedder
-    from .retriever import FAISSRetriever
+    from .retriever import FAISSRetriever, USearchRetriever
     RAG_AVAILABLE = True
 except ImportError:
     RAG_AVAILABLE = False
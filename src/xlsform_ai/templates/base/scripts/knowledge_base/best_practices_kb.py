@@ -1,10 +1,36 @@
 """Best Practices Knowledge Base for XLSForm."""
 
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import Any, Callable, Dict, Iterator, List, Tuple
 import re
 
 
+# Section headers (## or ###) used to chunk markdown documents
+_HEADER_RE = re.compile(r'\n#{2,3}\s+')
+
+# Sections shorter than this are skipped when building documents
+_MIN_SECTION_CHARS = 50
+
+# Constraint rule blocks start with a level-2 "## Pattern: <name>" header
+_RULE_BLOCK_RE = re.compile(r'^##(?!#)\s+', re.MULTILINE)
+_RULE_PATTERN_RE = re.compile(r'Pattern:\s*(.+)')
+_RULE_FIELD_RE = re.compile(
+    r'^###\s+(Type|Constraint|Message|Required Message|Required|Appearance):\s*(.+)$',
+    re.MULTILINE
+)
+_RULE_FIELD_MAP = {
+    "Type": "question_type",
+    "Constraint": "constraint",
+    "Message": "constraint_message",
+    "Required": "required",
+    "Required Message": "required_message",
+    "Appearance": "appearance",
+}
+
+# Parsed documents keyed by (path, mtime_ns, parser, args); shared across instances
+_DOCUMENT_CACHE: Dict[Tuple[Any, ...], List[Dict[str, Any]]] = {}
+
+
 class BestPracticesKB:
     """Load and manage XLSForm best practices knowledge base.
 
@@ -42,7 +68,8 @@ class BestPracticesKB:
         # Load ODK best practices
         odk_path = self.kb_path / "odk_best_practices.md"
         if odk_path.exists():
-            documents.extend(self._parse_markdown_document(
+            documents.extend(self._load_cached(
+                self._parse_markdown_document,
                 odk_path,
                 "ODK Best Practices",
                 "best_practices"
@@ -51,7 +78,8 @@ class BestPracticesKB:
         # Load DIME style guide
         dime_path = self.kb_path / "dime_style_guide.md"
         if dime_path.exists():
-            documents.extend(self._parse_markdown_document(
+            documents.extend(self._load_cached(
+                self._parse_markdown_document,
                 dime_path,
                 "DIME Analytics Style Guide",
                 "style_guide"
@@ -60,7 +88,8 @@ class BestPracticesKB:
         # Load question type patterns
         patterns_path = self.kb_path / "question_type_patterns.md"
         if patterns_path.exists():
-            documents.extend(self._parse_markdown_document(
+            documents.extend(self._load_cached(
+                self._parse_markdown_document,
                 patterns_path,
                 "Question Type Patterns",
                 "patterns"
@@ -69,13 +98,37 @@ class BestPracticesKB:
         # Load constraint rules
         constraints_path = self.kb_path / "constraint_rules.md"
         if constraints_path.exists():
-            documents.extend(self._parse_constraint_rules(
+            documents.extend(self._load_cached(
+                self._parse_constraint_rules,
                 constraints_path,
                 "Constraint Rules"
             ))
 
         return documents
 
+    def _load_cached(
+        self,
+        parser: Callable[..., List[Dict[str, Any]]],
+        filepath: Path,
+        *args: str
+    ) -> List[Dict[str, Any]]:
+        """Parse a KB file, reusing earlier results while its mtime is unchanged.
+
+        Args:
+            parser: Bound parse method to call on a cache miss
+            filepath: Path to the markdown file
+            *args: Extra arguments forwarded to ``parser``
+
+        Returns:
+            List of document chunks (a fresh list on every call)
+        """
+        key = (str(filepath.resolve()), filepath.stat().st_mtime_ns, parser.__name__, args)
+        documents = _DOCUMENT_CACHE.get(key)
+        if documents is None:
+            documents = parser(filepath, *args)
+            _DOCUMENT_CACHE[key] = documents
+        return list(documents)
+
     def _parse_markdown_document(
         self,
         filepath: Path,
@@ -95,17 +148,11 @@ class BestPracticesKB:
         with open(filepath, "r", encoding="utf-8") as f:
             content = f.read()
 
-        # Split into sections based on headers
-        sections = self._split_into_sections(content)
-
-        # Create documents from sections
+        # Create documents from header-delimited sections
         documents = []
-        for section in sections:
-            if len(section.strip()) < 50:  # Skip very short sections
-                continue
-
+        for section in self._split_into_sections(content):
             documents.append({
-                "text": section.strip(),
+                "text": section,
                 "metadata": {
                     "source": source,
                     "category": category,
@@ -115,22 +162,31 @@ class BestPracticesKB:
 
         return documents
 
-    def _split_into_sections(self, content: str) -> List[str]:
+    def _split_into_sections(self, content: str) -> Iterator[str]:
         """Split markdown content into sections based on headers.
 
+        Sections shorter than ``_MIN_SECTION_CHARS`` are skipped without
+        being copied out of ``content``.
+
         Args:
             content: Markdown content
 
-        Returns:
-            List of section texts
+        Yields:
+            Stripped section texts
         """
-        # Split by headers (## or ###)
-        sections = re.split(r'\n#{2,3}\s+', content)
-
-        # Filter out empty sections and the title
-        sections = [s.strip() for s in sections if s.strip()]
-
-        return sections
+        start = 0
+        for match in _HEADER_RE.finditer(content):
+            end = match.start()
+            if end - start >= _MIN_SECTION_CHARS:
+                section = content[start:end].strip()
+                if len(section) >= _MIN_SECTION_CHARS:
+                    yield section
+            start = match.end()
+
+        if len(content) - start >= _MIN_SECTION_CHARS:
+            section = content[start:].strip()
+            if len(section) >= _MIN_SECTION_CHARS:
+                yield section
 
     def _parse_constraint_rules(
         self,
@@ -159,15 +215,11 @@ class BestPracticesKB:
         ### Message: Age must be between 0 and 130
         # (and any description)
 
-        pattern_blocks = re.split(r'##\s+', content)
-
-        for block in pattern_blocks[1:]:  # Skip first empty block
-            lines = block.strip().split('\n')
-            if len(lines) < 4:
-                continue
+        for block in _RULE_BLOCK_RE.split(content)[1:]:  # Skip preamble
+            block = block.strip()
 
             # Parse pattern name
-            pattern_match = re.match(r'Pattern:\s*(.+)', lines[0])
+            pattern_match = _RULE_PATTERN_RE.match(block)
             if not pattern_match:
                 continue
             pattern = pattern_match.group(1).strip()
@@ -178,23 +230,14 @@ class BestPracticesKB:
                 "type": "constraint"
             }
 
-            for line in lines[1:]:
-                if line.startswith("### Type:"):
-                    rule["question_type"] = line.split(":", 1)[1].strip()
-                elif line.startswith("### Constraint:"):
-                    rule["constraint"] = line.split(":", 1)[1].strip()
-                elif line.startswith("### Message:"):
-                    rule["constraint_message"] = line.split(":", 1)[1].strip()
-                elif line.startswith("### Required:"):
-                    rule["required"] = line.split(":", 1)[1].strip()
-                elif line.startswith("### Required Message:"):
-                    rule["required_message"] = line.split(":", 1)[1].strip()
-                elif line.startswith("### Appearance:"):
-                    rule["appearance"] = line.split(":", 1)[1].strip()
+            fields_end = pattern_match.end()
+            for field_match in _RULE_FIELD_RE.finditer(block, fields_end):
+                rule[_RULE_FIELD_MAP[field_match.group(1)]] = field_match.group(2).strip()
+                fields_end = field_match.end()
 
             # Create document
             text = f"Constraint for {pattern} ({rule.get('question_type', 'unknown')}): {rule.get('constraint', '')}"
-            description = '\n'.join(lines[6:])  # Any remaining text is description
+            description = block[fields_end:].strip()  # Any remaining text is description
             if description:
                 text += f" {description}"
 
@@ -0,0 +1,55 @@
+"""Demo for SentenceTransformerEmbedder.
+
+Run from the scripts directory:
+    python -m knowledge_base.demo_embedder
+"""
+
+import os
+import tempfile
+
+import numpy as np
+
+from .embedder import SentenceTransformerEmbedder
+
+
+def main():
+    # Test the embedder
+    print("Testing SentenceTransformerEmbedder...")
+
+    embedder = SentenceTransformerEmbedder()
+
+    # Test single embedding
+    text = "Age field should be between 0 and 130 years"
+    embedding = embedder.embed(text)
+    print(f"Single embedding shape: {embedding.shape}")
+    print(f"First 5 values: {embedding[:5]}")
+
+    # Test batch embedding
+    texts = [
+        "What is your age?",
+        "Enter your name",
+        "Select your gender",
+        "How many children do you have?"
+    ]
+    embeddings = embedder.embed_batch(texts)
+    print(f"\nBatch embeddings shape: {embeddings.shape}")
+
+    # Test saving/loading
+    with tempfile.NamedTemporaryFile(suffix=".npy", delete=False) as f:
+        temp_path = f.name
+
+    embedder.save_embeddings(embeddings, temp_path)
+    print(f"\nSaved embeddings to: {temp_path}")
+
+    loaded = embedder.load_embeddings(temp_path)
+    print(f"Loaded embeddings shape: {loaded.shape}")
+    print(f"Arrays match (float16): {np.allclose(embeddings, loaded, atol=1e-3)}")
+
+    # Clean up
+    os.unlink(temp_path)
+
+    print("\n[OK] All tests passed!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""Demo for RAGEngine.
+
+Run from the scripts directory:
+    python -m knowledge_base.demo_rag
+"""
+
+from .rag_engine import RAGEngine
+
+
+def main():
+    # Test the RAG engine
+    print("Testing RAGEngine...")
+
+    # This will build a simple index from available documents
+    try:
+        rag = RAGEngine()
+        print("[OK] RAG Engine initialized")
+
+        # Test query
+        practices = rag.query_best_practices(
+            "What is your age?",
+            "integer",
+            {"section": "demographics"}
+        )
+        print(f"\n[OK] Query returned {len(practices)} best practices")
+
+        # Test constraint suggestions
+        rules = rag.get_constraint_suggestions("age", "integer", "What is your age?")
+        print(f"\n[OK] Got {len(rules)} constraint suggestions")
+        if rules:
+            print(f"  Best: {rules[0].constraint}")
+
+        print("\n[OK] All tests passed!")
+
+    except Exception as e:
+        print(f"\nNote: {e}")
+        print("This is expected if knowledge base documents don't exist yet.")
+        print("Create documents in data/ directory to enable full functionality.")
+
+
+if __name__ == "__main__":
+    main()
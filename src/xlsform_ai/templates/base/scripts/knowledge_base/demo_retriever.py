@@ -0,0 +1,60 @@
+"""Demo for FAISSRetriever.
+
+Run from the scripts directory:
+    python -m knowledge_base.demo_retriever
+"""
+
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+from .retriever import FAISSRetriever
+
+
+def main():
+    # Test the retriever
+    print("Testing FAISSRetriever...")
+
+    # Create sample data
+    np.random.seed(42)
+    num_docs = 100
+    embedding_dim = 384
+
+    embeddings = np.random.rand(num_docs, embedding_dim).astype('float32')
+    embeddings /= np.linalg.norm(embeddings, axis=1, keepdims=True)
+    metadata = [f"doc_{i}" for i in range(num_docs)]
+
+    # Build index
+    retriever = FAISSRetriever(embedding_dimension=embedding_dim)
+    retriever.build_index(embeddings, metadata)
+    print(f"[OK] Built index with {retriever.get_index_size()} embeddings")
+
+    # Test search
+    query = embeddings[0]  # Use first embedding as query
+    scores, ids = retriever.search(query, top_k=5)
+    print(f"\n[OK] Search returned {len(ids)} results:")
+    for i, (score, idx) in enumerate(zip(scores[:3], ids[:3])):
+        print(f"  {i+1}. Score: {score:.4f}, Metadata: {retriever.metadata[idx]}")
+
+    # Test save/load
+    with tempfile.TemporaryDirectory() as tmpdir:
+        save_path = Path(tmpdir) / "test_index"
+        retriever.save_index(save_path)
+        print(f"\n[OK] Saved index to: {save_path}")
+
+        # Create new retriever and load
+        new_retriever = FAISSRetriever(embedding_dimension=embedding_dim)
+        new_retriever.load_index(save_path)
+        print(f"[OK] Loaded index with {new_retriever.get_index_size()} embeddings")
+
+        # Verify search works
+        _, new_ids = new_retriever.search(query, top_k=5)
+        assert len(ids) == len(new_ids), "Search results length mismatch"
+        print("[OK] Loaded index produces same results")
+
+    print("\n[OK] All tests passed!")
+
+
+if __name__ == "__main__":
+    main()
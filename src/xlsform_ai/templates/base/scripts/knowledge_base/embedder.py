@@ -1,8 +1,11 @@
 """Sentence Transformer Embedder for XLSForm knowledge base."""
 
+import os
+import warnings
+
 import numpy as np
 from pathlib import Path
-from typing import List, Union
+from typing import List, Optional, Union
 
 try:
     from sentence_transformers import SentenceTransformer
@@ -10,6 +13,34 @@ try:
 except ImportError:
     SENTENCE_TRANSFORMERS_AVAILABLE = False
 
+try:
+    import onnxruntime  # noqa: F401
+    ONNX_AVAILABLE = True
+except ImportError:
+    ONNX_AVAILABLE = False
+
+
+# int8 dynamically-quantized ONNX export published alongside the MiniLM weights
+ONNX_QUANTIZED_FILE = "onnx/model_quint8_avx2.onnx"
+
+# Upper bound on torch intra-op threads; MiniLM encoding stops scaling past ~8
+TORCH_MAX_THREADS = 8
+
+
+def _configure_torch_threads():
+    """Tune torch CPU threading before the model is loaded."""
+    try:
+        import torch
+    except ImportError:
+        return
+
+    torch.set_num_threads(min(TORCH_MAX_THREADS, os.cpu_count() or 1))
+    try:
+        torch.set_num_interop_threads(1)
+    except RuntimeError:
+        # Inter-op pool already started by earlier torch work; keep its size
+        pass
+
 
 class SentenceTransformerEmbedder:
     """Generate embeddings using sentence-transformers.
@@ -23,12 +54,14 @@ class SentenceTransformerEmbedder:
         >>> print(embedding.shape)  # (384,)
     """
 
-    def __init__(self, model_name: str = "all-MiniLM-L6-v2"):
+    def __init__(self, model_name: str = "all-MiniLM-L6-v2", backend: Optional[str] = None):
         """Initialize the embedder.
 
         Args:
             model_name: Name of the sentence-transformers model.
                        Default is all-MiniLM-L6-v2 (lightweight, fast).
+            backend: "onnx" (int8-quantized ONNX Runtime) or "torch".
+                     Defaults to "onnx" when onnxruntime is installed.
 
         Raises:
             ImportError: If sentence-transformers is not installed.
@@ -40,12 +73,50 @@ class SentenceTransformerEmbedder:
             )
 
         self.model_name = model_name
+        self.backend = backend or ("onnx" if ONNX_AVAILABLE else "torch")
         self.model = None  # Lazy loading
 
     def _load_model(self):
         """Lazy load the model (only when first used)."""
-        if self.model is None:
-            self.model = SentenceTransformer(self.model_name)
+        if self.model is not None:
+            return
+
+        if self.backend == "onnx":
+            try:
+                self.model = SentenceTransformer(
+                    self.model_name,
+                    backend="onnx",
+                    model_kwargs={"file_name": ONNX_QUANTIZED_FILE},
+                )
+                return
+            except (ImportError, OSError) as e:
+                # ONNX extras not installed or no quantized export; use torch
+                warnings.warn(
+                    f"ONNX backend unavailable for {self.model_name} ({e}); falling back to torch.",
+                    RuntimeWarning,
+                    stacklevel=2,
+                )
+                self.backend = "torch"
+
+        _configure_torch_threads()
+        self.model = SentenceTransformer(self.model_name)
+
+    @property
+    def backend_id(self) -> str:
+        """Identity of the loaded model: model id, backend, and quantization.
+
+        Loads the model first, since the ONNX backend may fall back to torch.
+        Embeddings from different backends are not interchangeable, so this
+        keys both cached query embeddings and the persisted index.
+
+        Example:
+            >>> SentenceTransformerEmbedder().backend_id
+            'all-MiniLM-L6-v2:onnx:model_quint8_avx2'
+        """
+        self._load_model()
+        if self.backend == "onnx":
+            return f"{self.model_name}:onnx:{Path(ONNX_QUANTIZED_FILE).stem}"
+        return f"{self.model_name}:torch"
 
     def embed(self, text: str) -> np.ndarray:
         """Generate embedding for a single text string.
@@ -54,7 +125,7 @@ class SentenceTransformerEmbedder:
             text: Text to embed.
 
         Returns:
-            Numpy array of shape (384,) for all-MiniLM-L6-v2.
+            L2-normalized numpy array of shape (384,) for all-MiniLM-L6-v2.
 
         Example:
             >>> embedder = SentenceTransformerEmbedder()
@@ -63,17 +134,21 @@ class SentenceTransformerEmbedder:
             (384,)
         """
         self._load_model()
-        return self.model.encode(text, convert_to_numpy=True)
+        return self.model.encode(text, convert_to_numpy=True, normalize_embeddings=True)
 
     def embed_batch(self, texts: List[str], batch_size: int = 32) -> np.ndarray:
         """Generate embeddings for multiple texts efficiently.
 
+        ``model.encode`` sorts texts by length before batching and restores
+        input order afterwards, so each batch is padded only to its own
+        longest text. Embeddings are L2-normalized for cosine search.
+
         Args:
             texts: List of texts to embed.
             batch_size: Batch size for processing (default: 32).
 
         Returns:
-            Numpy array of shape (len(texts), 384).
+            Numpy array of shape (len(texts), 384), L2-normalized.
 
         Example:
             >>> embedder = SentenceTransformerEmbedder()
@@ -83,43 +158,59 @@ class SentenceTransformerEmbedder:
             (3, 384)
         """
         self._load_model()
-        return self.model.encode(texts, batch_size=batch_size, convert_to_numpy=True)
+        return self.model.encode(
+            texts,
+            batch_size=batch_size,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+        )
 
     def save_embeddings(self, embeddings: np.ndarray, filepath: Union[str, Path]):
         """Save embeddings to disk for later reuse.
 
+        ``.npy`` files are written as float16, halving disk size and allowing
+        zero-copy memory-mapped loads. ``.pkl`` is deprecated.
+
         Args:
             embeddings: Numpy array of embeddings.
-            filepath: Path to save the embeddings (.pkl or .npy).
+            filepath: Path to save the embeddings (.npy, or deprecated .pkl).
 
         Example:
             >>> embedder = SentenceTransformerEmbedder()
             >>> embeddings = embedder.embed_batch(["question 1", "question 2"])
-            >>> embedder.save_embeddings(embeddings, "embeddings.pkl")
+            >>> embedder.save_embeddings(embeddings, "embeddings.npy")
         """
         filepath = Path(filepath)
 
         if filepath.suffix == ".pkl":
+            warnings.warn(
+                "Saving embeddings as .pkl is deprecated; use .npy instead.",
+                DeprecationWarning,
+                stacklevel=2,
+            )
             import pickle
             with open(filepath, "wb") as f:
                 pickle.dump(embeddings, f)
         elif filepath.suffix == ".npy":
-            np.save(filepath, embeddings)
+            np.save(filepath, np.asarray(embeddings).astype(np.float16))
         else:
-            raise ValueError(f"Unsupported file format: {filepath.suffix}. Use .pkl or .npy")
+            raise ValueError(f"Unsupported file format: {filepath.suffix}. Use .npy")
 
     def load_embeddings(self, filepath: Union[str, Path]) -> np.ndarray:
         """Load embeddings from disk.
 
+        ``.npy`` files are memory-mapped read-only, so loading is instant
+        regardless of size; FAISS casts to float32 when the vectors are added.
+
         Args:
-            filepath: Path to the embeddings file (.pkl or .npy).
+            filepath: Path to the embeddings file (.npy, or legacy .pkl).
 
         Returns:
             Numpy array of embeddings.
 
         Example:
             >>> embedder = SentenceTransformerEmbedder()
-            >>> embeddings = embedder.load_embeddings("embeddings.pkl")
+            >>> embeddings = embedder.load_embeddings("embeddings.npy")
             >>> print(embeddings.shape)
             (100, 384)
         """
@@ -133,9 +224,9 @@ class SentenceTransformerEmbedder:
             with open(filepath, "rb") as f:
                 return pickle.load(f)
         elif filepath.suffix == ".npy":
-            return np.load(filepath)
+            return np.load(filepath, mmap_mode="r")
         else:
-            raise ValueError(f"Unsupported file format: {filepath.suffix}. Use .pkl or .npy")
+            raise ValueError(f"Unsupported file format: {filepath.suffix}. Use .npy")
 
     def get_embedding_dimension(self) -> int:
         """Get the dimension of embeddings produced by this model.
@@ -150,44 +241,3 @@ class SentenceTransformerEmbedder:
         """
         self._load_model()
         return self.model.get_sentence_embedding_dimension()
-
-
-if __name__ == "__main__":
-    # Test the embedder
-    print("Testing SentenceTransformerEmbedder...")
-
-    embedder = SentenceTransformerEmbedder()
-
-    # Test single embedding
-    text = "Age field should be between 0 and 130 years"
-    embedding = embedder.embed(text)
-    print(f"Single embedding shape: {embedding.shape}")
-    print(f"First 5 values: {embedding[:5]}")
-
-    # Test batch embedding
-    texts = [
-        "What is your age?",
-        "Enter your name",
-        "Select your gender",
-        "How many children do you have?"
-    ]
-    embeddings = embedder.embed_batch(texts)
-    print(f"\nBatch embeddings shape: {embeddings.shape}")
-
-    # Test saving/loading
-    import tempfile
-    with tempfile.NamedTemporaryFile(suffix=".npy", delete=False) as f:
-        temp_path = f.name
-
-    embedder.save_embeddings(embeddings, temp_path)
-    print(f"\nSaved embeddings to: {temp_path}")
-
-    loaded = embedder.load_embeddings(temp_path)
-    print(f"Loaded embeddings shape: {loaded.shape}")
-    print(f"Arrays equal: {np.array_equal(embeddings, loaded)}")
-
-    # Clean up
-    import os
-    os.unlink(temp_path)
-
-    print("\n[OK] All tests passed!")
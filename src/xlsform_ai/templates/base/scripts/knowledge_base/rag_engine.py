@@ -1,11 +1,31 @@
 """RAG Engine for XLSForm knowledge base."""
 
+import os
 from pathlib import Path
-from typing import List, Dict, Any, Optional
-from dataclasses import dataclass
+from typing import List, Dict, Any, Optional, Tuple
+from dataclasses import dataclass, replace
+from functools import lru_cache
+
+import numpy as np
 
 from .embedder import SentenceTransformerEmbedder
-from .retriever import FAISSRetriever
+from .reranker import NO_CATEGORY, rerank
+from .retriever import (
+    FAISSRetriever,
+    USearchRetriever,
+    USEARCH_AVAILABLE,
+    USEARCH_MAX_DOCUMENTS,
+)
+
+
+# Maximum number of query embeddings kept per engine
+QUERY_CACHE_SIZE = 4096
+
+# Documents embedded and added to the index per step when building
+EMBED_CHUNK_SIZE = 1024
+
+# Sidecar recording which embedder backend produced the persisted index
+INDEX_BACKEND_FILE = "kb_index.backend"
 
 
 @dataclass
@@ -17,7 +37,7 @@ class BestPractice:
     relevance_score: float
 
 
-@dataclass
+@dataclass(frozen=True)
 class ConstraintRule:
     """Constraint rule from knowledge base."""
     question_type: str
@@ -39,6 +59,45 @@ class QuestionPattern:
     source: str
 
 
+# Fallback rules used when the knowledge base has no matching constraint
+_DEFAULT_AGE_CONSTRAINT = ConstraintRule(
+    question_type="integer",
+    pattern="age",
+    constraint=". >= 0 and . <= 130",
+    constraint_message="Age must be between 0 and 130",
+    required="yes",
+    required_message="Age is required",
+    relevance_score=0.5
+)
+_DEFAULT_INTEGER_CONSTRAINT = ConstraintRule(
+    question_type="integer",
+    pattern="integer",
+    constraint=". >= 0",
+    constraint_message="Value must be zero or positive",
+    required="yes",
+    required_message="This field is required",
+    relevance_score=0.5
+)
+_DEFAULT_DECIMAL_CONSTRAINT = ConstraintRule(
+    question_type="decimal",
+    pattern="decimal",
+    constraint=". > 0",
+    constraint_message="Value must be positive",
+    required="yes",
+    required_message="This field is required",
+    relevance_score=0.5
+)
+_DEFAULT_OTHER_CONSTRAINT = ConstraintRule(
+    question_type="",
+    pattern="default",
+    constraint="",
+    constraint_message="",
+    required="yes",
+    required_message="This field is required",
+    relevance_score=0.5
+)
+
+
 class RAGEngine:
     """RAG system for XLSForm knowledge retrieval.
 
@@ -67,21 +126,61 @@ class RAGEngine:
 
         # Initialize components
         self.embedder = SentenceTransformerEmbedder()
-        self.retriever = FAISSRetriever(
-            embedding_dimension=self.embedder.get_embedding_dimension()
-        )
+        self.retriever = None  # Chosen when the index is loaded or built
+        self._index_backend: Optional[str] = None  # Embedder backend_id the index was built with
+
+        # The model loads on first query unless eager loading is requested,
+        # moving the ~1-2s load out of the first user-facing lookup
+        if os.environ.get("XLSFORM_EAGER_LOAD") == "1":
+            self.embedder._load_model()
+
+        # Per-engine LRU of query embeddings, keyed by (backend_id, text)
+        self._embed_lru = lru_cache(maxsize=QUERY_CACHE_SIZE)(self._embed_uncached)
 
         # Load or build index
         self._load_or_build_index()
 
+    def _embed_uncached(self, backend_id: str, text: str) -> np.ndarray:
+        """Embed text and freeze the result so cached arrays stay immutable."""
+        embedding = self.embedder.embed(text)
+        embedding.setflags(write=False)
+        return embedding
+
+    def _embed_cached(self, text: str) -> np.ndarray:
+        """Return the query embedding, reusing earlier results for identical text.
+
+        The index is rebuilt first if it was embedded by a different model or
+        backend than the one now loaded, since their vectors do not compare.
+        """
+        backend_id = self.embedder.backend_id
+        if backend_id != self._index_backend:
+            print(
+                f"Warning: Index was built with {self._index_backend or 'an unknown embedder'}, "
+                f"not {backend_id}. Building new index."
+            )
+            self._build_index()
+        return self._embed_lru(backend_id, text)
+
     def _load_or_build_index(self):
         """Load existing index or build from knowledge base documents."""
         index_path = self.embeddings_path / "kb_index"
 
         # Try to load existing index
-        if index_path.with_suffix(".faiss").exists():
+        for suffix, retriever_class in ((".usearch", USearchRetriever), (".faiss", FAISSRetriever)):
+            if not index_path.with_suffix(suffix).exists():
+                continue
             try:
-                self.retriever.load_index(index_path)
+                retriever = retriever_class()  # Dimension is read from the index
+                retriever.load_index(index_path)
+                retriever.metadata_codes("category")  # Precompute re-ranker category ids
+                self.retriever = retriever
+
+                # Checked against the loaded embedder on first query, so the
+                # model still loads lazily
+                backend_path = self.embeddings_path / INDEX_BACKEND_FILE
+                self._index_backend = (
+                    backend_path.read_text(encoding="utf-8").strip() if backend_path.exists() else None
+                )
                 return
             except Exception as e:
                 print(f"Warning: Could not load index: {e}. Building new index.")
@@ -89,6 +188,13 @@ class RAGEngine:
         # Build index from documents
         self._build_index()
 
+    def _create_retriever(self, num_documents: int):
+        """Use USearch exact search for small corpora when installed, else FAISS."""
+        embedding_dimension = self.embedder.get_embedding_dimension()
+        if USEARCH_AVAILABLE and num_documents < USEARCH_MAX_DOCUMENTS:
+            return USearchRetriever(embedding_dimension=embedding_dimension)
+        return FAISSRetriever(embedding_dimension=embedding_dimension)
+
     def _build_index(self):
         """Build index from knowledge base documents."""
         # Import document processor
@@ -98,22 +204,35 @@ class RAGEngine:
 
         # Load all documents
         documents = kb.load_all_documents()
+        self.retriever = self._create_retriever(len(documents))
+        self._index_backend = self.embedder.backend_id
 
         if not documents:
             print("Warning: No documents found in knowledge base.")
             return
 
-        # Generate embeddings
-        texts = [doc["text"] for doc in documents]
-        embeddings = self.embedder.embed_batch(texts)
+        # Embed and index in chunks so only one chunk of vectors is in memory;
+        # the first chunk is large enough to train quantized indexes
+        self.retriever.init_index(len(documents))
+        chunk_size = max(EMBED_CHUNK_SIZE, self.retriever.training_size(len(documents)))
+        start = 0
+        while start < len(documents):
+            chunk = documents[start:start + chunk_size]
+            embeddings = self.embedder.embed_batch([doc["text"] for doc in chunk])
 
-        # Build index with metadata
-        metadata = [doc["metadata"] for doc in documents]
-        self.retriever.build_index(embeddings, metadata)
+            # Text is included in metadata so hits can be shown directly
+            metadata = [{**doc["metadata"], "text": doc["text"]} for doc in chunk]
+            self.retriever.add(embeddings, metadata)
+
+            start += chunk_size
+            chunk_size = EMBED_CHUNK_SIZE
+
+        self.retriever.metadata_codes("category")  # Precompute re-ranker category ids
 
         # Save index
         self.embeddings_path.mkdir(parents=True, exist_ok=True)
         self.retriever.save_index(self.embeddings_path / "kb_index")
+        (self.embeddings_path / INDEX_BACKEND_FILE).write_text(self._index_backend, encoding="utf-8")
         print(f"[OK] Built index with {len(documents)} documents")
 
     def query_best_practices(
@@ -127,7 +246,8 @@ class RAGEngine:
         Args:
             question_text: The question label/text
             question_type: Detected XLSForm type (e.g., "integer", "text")
-            context: Form context (section, nearby questions, etc.)
+            context: Form context (section, category, nearby questions, etc.);
+                a "category" promotes matching best practices
 
         Returns:
             Ranked list of best practice recommendations
@@ -141,31 +261,10 @@ class RAGEngine:
             >>> for practice in practices:
             ...     print(f"{practice.category}: {practice.text}")
         """
-        # Construct query
-        query = f"{question_type} {question_text}"
-        if context.get("section"):
-            query += f" section:{context['section']}"
-        if context.get("keywords"):
-            query += f" keywords:{','.join(context['keywords'])}"
-
-        # Generate embedding
-        query_embedding = self.embedder.embed(query)
-
-        # Search
-        results = self.retriever.search(query_embedding, top_k=5)
-
-        # Format results
-        practices = []
-        for result in results:
-            metadata = result["metadata"]
-            practices.append(BestPractice(
-                text=metadata.get("text", ""),
-                category=metadata.get("category", "general"),
-                source=metadata.get("source", "Knowledge Base"),
-                relevance_score=result["score"]
-            ))
-
-        return practices
+        query = self._best_practices_query(question_text, question_type, context)
+        embedding = self._embed_cached(query)  # May rebuild self.retriever
+        results = self.retriever.search(embedding, top_k=5)
+        return self._to_best_practices(self._rerank_by_category(results, context))
 
     def get_constraint_suggestions(
         self,
@@ -189,33 +288,10 @@ class RAGEngine:
             >>> print(f"Constraint: {best_rule.constraint}")
             . >= 0 and . <= 130
         """
-        # Query for constraint patterns
-        query = f"constraint {question_type} {question_name} {question_label}"
-        query_embedding = self.embedder.embed(query)
-
-        results = self.retriever.search(query_embedding, top_k=3)
-
-        # Format results
-        rules = []
-        for result in results:
-            metadata = result["metadata"]
-            if metadata.get("type") == "constraint":
-                rules.append(ConstraintRule(
-                    question_type=question_type,
-                    pattern=metadata.get("pattern", ""),
-                    constraint=metadata.get("constraint", ""),
-                    constraint_message=metadata.get("constraint_message", ""),
-                    required=metadata.get("required", "yes"),
-                    required_message=metadata.get("required_message", ""),
-                    appearance=metadata.get("appearance", ""),
-                    relevance_score=result["score"]
-                ))
-
-        # If no rules found, return basic default
-        if not rules:
-            rules.append(self._get_default_constraint(question_type, question_name))
-
-        return rules
+        query = self._constraint_query(question_name, question_type, question_label)
+        embedding = self._embed_cached(query)  # May rebuild self.retriever
+        results = self.retriever.search_typed(embedding, "constraint", top_k=3)
+        return self._to_constraint_rules(results, question_name, question_type)
 
     def find_similar_questions(
         self,
@@ -236,23 +312,158 @@ class RAGEngine:
             >>> for q in similar:
             ...     print(f"{q['type']}: {q['label']}")
         """
-        query = f"question {question_text}"
-        query_embedding = self.embedder.embed(query)
+        query = self._similar_questions_query(question_text)
+        embedding = self._embed_cached(query)  # May rebuild self.retriever
+        results = self.retriever.search_typed(embedding, "question", top_k=top_k)
+        return self._to_similar_questions(results)
+
+    def query_all(
+        self,
+        question_text: str,
+        question_type: str,
+        context: Dict[str, Any],
+        question_name: str = ""
+    ) -> Dict[str, Any]:
+        """Run best-practice, constraint, and similar-question lookups at once.
+
+        Each row gives the same results as the matching single-purpose
+        method: best practices search the full index, while constraints and
+        similar questions are scored within their own document type in one
+        batched typed search.
+
+        Args:
+            question_text: The question label/text
+            question_type: Detected XLSForm type (e.g., "integer", "text")
+            context: Form context (section, category, nearby questions, etc.);
+                a "category" promotes matching best practices
+            question_name: Question variable name, used for constraint lookup
+
+        Returns:
+            Dictionary with keys: best_practices, constraints, similar_questions
+
+        Example:
+            >>> results = rag.query_all("What is your age?", "integer", {}, "age")
+            >>> print(results["constraints"][0].constraint)
+        """
+        queries = np.vstack([
+            self._embed_cached(self._best_practices_query(question_text, question_type, context)),
+            self._embed_cached(self._constraint_query(question_name, question_type, question_text)),
+            self._embed_cached(self._similar_questions_query(question_text)),
+        ])
+        practices = self.retriever.search_batch(queries[:1], top_k=5)[0]
+        constraints, similar = self.retriever.search_typed_batch(
+            queries[1:], ["constraint", "question"], top_k=3
+        )
+
+        return {
+            "best_practices": self._to_best_practices(self._rerank_by_category(practices, context)),
+            "constraints": self._to_constraint_rules(constraints, question_name, question_type),
+            "similar_questions": self._to_similar_questions(similar),
+        }
+
+    def _best_practices_query(
+        self,
+        question_text: str,
+        question_type: str,
+        context: Dict[str, Any]
+    ) -> str:
+        """Build the best-practices query string."""
+        parts = [question_type, question_text]
+        if context.get("section"):
+            parts.append(f"section:{context['section']}")
+        if context.get("keywords"):
+            parts.append(f"keywords:{','.join(context['keywords'])}")
+        return " ".join(parts)
+
+    def _constraint_query(self, question_name: str, question_type: str, question_label: str) -> str:
+        """Build the constraint-pattern query string."""
+        return " ".join(("constraint", question_type, question_name, question_label))
 
-        results = self.retriever.search(query_embedding, top_k=top_k)
+    def _similar_questions_query(self, question_text: str) -> str:
+        """Build the similar-questions query string."""
+        return f"question {question_text}"
 
+    def _rerank_by_category(
+        self,
+        results: Tuple[np.ndarray, np.ndarray],
+        context: Dict[str, Any]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Promote hits whose category matches ``context["category"]``."""
+        scores, ids = results
+        category = context.get("category")
+        if not category or len(ids) < 2:
+            return results
+        cat_ids, vocabulary = self.retriever.metadata_codes("category")
+        query_cat = np.int32(vocabulary.get(category, NO_CATEGORY))
+        order = rerank(np.ascontiguousarray(scores, dtype=np.float32), cat_ids[ids], query_cat)
+        return scores[order], ids[order]
+
+    def _to_best_practices(self, results: Tuple[np.ndarray, np.ndarray]) -> List[BestPractice]:
+        """Format (scores, ids) search results as best practice recommendations."""
+        practices = []
+        for score, idx in zip(*results):
+            metadata = self.retriever.metadata[idx]
+            practices.append(BestPractice(
+                text=metadata.get("text", ""),
+                category=metadata.get("category", "general"),
+                source=metadata.get("source", "Knowledge Base"),
+                relevance_score=float(score)
+            ))
+
+        return practices
+
+    def _to_constraint_rules(
+        self,
+        results: Tuple[np.ndarray, np.ndarray],
+        question_name: str,
+        question_type: str
+    ) -> List[ConstraintRule]:
+        """Format search results as constraint rules, falling back to a default."""
+        rules = []
+        for score, idx in zip(*self._filter_by_type(results, "constraint")):
+            metadata = self.retriever.metadata[idx]
+            rules.append(ConstraintRule(
+                question_type=question_type,
+                pattern=metadata.get("pattern", ""),
+                constraint=metadata.get("constraint", ""),
+                constraint_message=metadata.get("constraint_message", ""),
+                required=metadata.get("required", "yes"),
+                required_message=metadata.get("required_message", ""),
+                appearance=metadata.get("appearance", ""),
+                relevance_score=float(score)
+            ))
+
+        # If no rules found, return basic default
+        if not rules:
+            rules.append(self._get_default_constraint(question_type, question_name))
+
+        return rules
+
+    def _to_similar_questions(self, results: Tuple[np.ndarray, np.ndarray]) -> List[Dict[str, Any]]:
+        """Format (scores, ids) search results as similar-question matches."""
         similar = []
-        for result in results:
-            metadata = result["metadata"]
-            if metadata.get("type") == "question":
-                similar.append({
-                    "type": metadata.get("question_type", ""),
-                    "label": metadata.get("label", ""),
-                    "confidence": result["score"]
-                })
+        for score, idx in zip(*self._filter_by_type(results, "question")):
+            metadata = self.retriever.metadata[idx]
+            similar.append({
+                "type": metadata.get("question_type", ""),
+                "label": metadata.get("label", ""),
+                "confidence": float(score)
+            })
 
         return similar
 
+    def _filter_by_type(
+        self,
+        results: Tuple[np.ndarray, np.ndarray],
+        doc_type: str
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Keep results whose metadata type matches, via the retriever's type column."""
+        scores, ids = results
+        if not len(ids):
+            return results
+        keep = self.retriever.metadata_column("type")[ids] == doc_type
+        return scores[keep], ids[keep]
+
     def _get_default_constraint(
         self,
         question_type: str,
@@ -262,73 +473,8 @@ class RAGEngine:
         # Basic defaults based on type
         if question_type == "integer":
             if "age" in question_name.lower():
-                return ConstraintRule(
-                    question_type=question_type,
-                    pattern="age",
-                    constraint=". >= 0 and . <= 130",
-                    constraint_message="Age must be between 0 and 130",
-                    required="yes",
-                    required_message="Age is required",
-                    relevance_score=0.5
-                )
-            else:
-                return ConstraintRule(
-                    question_type=question_type,
-                    pattern="integer",
-                    constraint=". >= 0",
-                    constraint_message="Value must be zero or positive",
-                    required="yes",
-                    required_message="This field is required",
-                    relevance_score=0.5
-                )
-        elif question_type == "decimal":
-            return ConstraintRule(
-                question_type=question_type,
-                pattern="decimal",
-                constraint=". > 0",
-                constraint_message="Value must be positive",
-                required="yes",
-                required_message="This field is required",
-                relevance_score=0.5
-            )
-        else:
-            return ConstraintRule(
-                question_type=question_type,
-                pattern="default",
-                constraint="",
-                constraint_message="",
-                required="yes",
-                required_message="This field is required",
-                relevance_score=0.5
-            )
-
-
-if __name__ == "__main__":
-    # Test the RAG engine
-    print("Testing RAGEngine...")
-
-    # This will build a simple index from available documents
-    try:
-        rag = RAGEngine()
-        print("[OK] RAG Engine initialized")
-
-        # Test query
-        practices = rag.query_best_practices(
-            "What is your age?",
-            "integer",
-            {"section": "demographics"}
-        )
-        print(f"\n[OK] Query returned {len(practices)} best practices")
-
-        # Test constraint suggestions
-        rules = rag.get_constraint_suggestions("age", "integer", "What is your age?")
-        print(f"\n[OK] Got {len(rules)} constraint suggestions")
-        if rules:
-            print(f"  Best: {rules[0].constraint}")
-
-        print("\n[OK] All tests passed!")
-
-    except Exception as e:
-        print(f"\nNote: {e}")
-        print("This is expected if knowledge base documents don't exist yet.")
-        print("Create documents in data/ directory to enable full functionality.")
+                return _DEFAULT_AGE_CONSTRAINT
+            return _DEFAULT_INTEGER_CONSTRAINT
+        if question_type == "decimal":
+            return _DEFAULT_DECIMAL_CONSTRAINT
+        return replace(_DEFAULT_OTHER_CONSTRAINT, question_type=question_type)
@@ -0,0 +1,42 @@
+"""Re-ranking of retrieved candidates for XLSForm knowledge base."""
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Fallback decorator that leaves the function as plain Python."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+# Score added to candidates whose category matches the query category
+CATEGORY_BOOST = 0.1
+
+# Category id that never matches a candidate (query has no known category)
+NO_CATEGORY = -1
+
+
+@njit(cache=True)
+def rerank(scores: np.ndarray, cat_ids: np.ndarray, query_cat: int) -> np.ndarray:
+    """Order candidates by cosine score plus a category-match boost.
+
+    Args:
+        scores: float32 cosine scores of the retrieved candidates.
+        cat_ids: int32 category ids of the same candidates.
+        query_cat: Category id of the query, or NO_CATEGORY.
+
+    Returns:
+        int32 positions into ``scores``, best first.
+
+    Example:
+        >>> order = rerank(scores, cat_ids[ids], np.int32(2))
+        >>> scores, ids = scores[order], ids[order]
+    """
+    boosted = scores + np.float32(CATEGORY_BOOST) * (cat_ids == query_cat).astype(np.float32)
+    return np.argsort(-boosted, kind="mergesort").astype(np.int32)
@@ -1,5 +1,8 @@
-"""FAISS-based vector retriever for fast similarity search."""
+"""Vector retrievers (FAISS, USearch) for fast similarity search."""
 
+import abc
+import math
+import os
 import numpy as np
 import pickle
 from pathlib import Path
@@ -11,90 +14,311 @@ try:
 except ImportError:
     FAISS_AVAILABLE = False
 
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
 
-class FAISSRetriever:
-    """FAISS-based vector retriever for fast similarity search.
+try:
+    from usearch.index import Index as USearchIndex
+    USEARCH_AVAILABLE = True
+except ImportError:
+    USEARCH_AVAILABLE = False
 
-    Uses FAISS (Facebook AI Similarity Search) for efficient vector similarity
-    search. Supports saving and loading indexes for persistence.
 
-    Example:
-        >>> retriever = FAISSRetriever(embedding_dimension=384)
-        >>> embeddings = np.random.rand(100, 384)  # 100 embeddings
-        >>> retriever.build_index(embeddings, metadata=["doc_1", "doc_2", ...])
-        >>> results = retriever.search(query_embedding, top_k=5)
+# Corpora smaller than this use a flat 8-bit scalar-quantized index; larger ones use IVF-PQ
+IVF_MIN_DOCUMENTS = 10_000
+
+# Dimensions per PQ sub-quantizer (384 / 8 = 48 sub-quantizers of 8 bits)
+PQ_SUBVECTOR_DIM = 8
+
+# Corpora smaller than this may use USearch exact search instead of FAISS
+USEARCH_MAX_DOCUMENTS = 100_000
+
+
+def _is_normalized(vectors: np.ndarray) -> bool:
+    """Check that every row has unit L2 norm (used in debug assertions)."""
+    return bool(np.allclose(np.linalg.norm(vectors, axis=1), 1.0, atol=1e-3))
+
+
+def _ivf_nlist(num_vectors: int) -> int:
+    """Number of IVF inverted lists for a corpus (~4 * sqrt(n))."""
+    return max(1, int(4 * math.sqrt(num_vectors)))
+
+
+def _gpu_count() -> int:
+    """Return number of GPUs visible to FAISS (0 for CPU-only builds)."""
+    if not FAISS_AVAILABLE or not hasattr(faiss, "StandardGpuResources"):
+        return 0
+    return faiss.get_num_gpus()
+
+
+def _metadata_path(filepath: Path, suffix: str = ".pkl") -> Path:
+    """Return the metadata sidecar path for an index path (without extension)."""
+    return filepath.with_name(f"{filepath.name}_metadata{suffix}")
+
+
+def _metadata_to_table(metadata: List[Any]):
+    """Convert list-of-dict metadata to an Arrow table, or None if not tabular."""
+    if not metadata or not all(isinstance(row, dict) for row in metadata):
+        return None
+
+    # Union of keys across rows; from_pylist would only use the first row's keys
+    columns: Dict[str, None] = {}
+    for row in metadata:
+        columns.update(dict.fromkeys(row))
+    try:
+        return pa.table({
+            column: pa.array([row.get(column) for row in metadata]).dictionary_encode()
+            for column in columns
+        })
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return None
+
+
+def _table_to_metadata(table) -> List[Dict[str, Any]]:
+    """Convert an Arrow table back to list-of-dict metadata, dropping absent keys."""
+    return [
+        {key: value for key, value in row.items() if value is not None}
+        for row in table.to_pylist()
+    ]
+
+
+class BaseRetriever(abc.ABC):
+    """Shared metadata handling and result formatting for vector retrievers.
+
+    Subclasses own the vector index and implement ``_create_empty_index``,
+    ``_add_vectors``, ``_search_index``, ``_reconstruct``, ``save_index``,
+    ``load_index`` and ``get_index_size``.
     """
 
     def __init__(self, embedding_dimension: int = 384):
-        """Initialize the FAISS retriever.
+        """Initialize the retriever.
 
         Args:
             embedding_dimension: Dimension of embeddings (384 for all-MiniLM-L6-v2).
-
-        Raises:
-            ImportError: If faiss-cpu is not installed.
         """
-        if not FAISS_AVAILABLE:
-            raise ImportError(
-                "faiss-cpu is not installed. "
-                "Install it with: pip install faiss-cpu"
-            )
-
         self.embedding_dimension = embedding_dimension
         self.index = None
         self.metadata: List[Any] = []  # Store metadata for each embedding
+        self._columns: Dict[str, np.ndarray] = {}  # Per-field views of metadata
+        self._codes: Dict[str, Tuple[np.ndarray, Dict[str, int]]] = {}  # Per-field int32 codes
+        self._typed_subsets: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}  # type -> (ids, vectors)
+
+    def _prepare_embeddings(self, embeddings: np.ndarray) -> np.ndarray:
+        """Validate corpus embeddings and return them as float32."""
+        if embeddings.shape[1] != self.embedding_dimension:
+            raise ValueError(
+                f"Embedding dimension mismatch: expected {self.embedding_dimension}, "
+                f"got {embeddings.shape[1]}"
+            )
+
+        # Embeddings arrive L2-normalized from the embedder (input may be a float16 memmap)
+        embeddings = np.asarray(embeddings, dtype='float32')
+        assert _is_normalized(embeddings), "Embeddings must be L2-normalized"
+        return embeddings
 
     def build_index(self, embeddings: np.ndarray, metadata: List[Any] = None):
-        """Build FAISS index from embeddings.
+        """Build index from embeddings.
 
         Args:
-            embeddings: Numpy array of shape (n, embedding_dim).
+            embeddings: L2-normalized numpy array of shape (n, embedding_dim).
             metadata: Optional list of metadata for each embedding.
 
         Example:
             >>> retriever = FAISSRetriever(embedding_dimension=384)
-            >>> embeddings = np.random.rand(100, 384)
+            >>> embeddings = embedder.embed_batch(texts)
             >>> retriever.build_index(embeddings, metadata=["doc_1", "doc_2", ...])
         """
-        if embeddings.shape[1] != self.embedding_dimension:
+        self.init_index(len(embeddings))
+        self.add(embeddings, metadata)
+
+    def init_index(self, num_vectors: int):
+        """Create an empty index sized for ``num_vectors`` embeddings.
+
+        Use with ``add`` to build an index chunk by chunk without holding
+        every embedding in memory at once.
+
+        Args:
+            num_vectors: Total number of embeddings that will be added.
+        """
+        self.index = self._create_empty_index(num_vectors)
+        self.metadata = []
+        self._reset_metadata_views()
+
+    def training_size(self, num_vectors: int) -> int:
+        """Number of embeddings the first ``add`` call should contain for training."""
+        return 0
+
+    def add(self, embeddings: np.ndarray, metadata: List[Any] = None):
+        """Append embeddings (and their metadata) to an initialized index.
+
+        Args:
+            embeddings: L2-normalized numpy array of shape (n, embedding_dim).
+            metadata: Optional list of metadata for each embedding.
+
+        Example:
+            >>> retriever.init_index(len(documents))
+            >>> for chunk in chunks:
+            ...     retriever.add(embedder.embed_batch(chunk_texts), chunk_metadata)
+        """
+        if self.index is None:
+            raise ValueError("Index not initialized. Call init_index() first.")
+
+        embeddings = self._prepare_embeddings(embeddings)
+        start = len(self.metadata)
+        if metadata is None:
+            metadata = range(start, start + len(embeddings))
+        elif len(metadata) != len(embeddings):
             raise ValueError(
-                f"Embedding dimension mismatch: expected {self.embedding_dimension}, "
-                f"got {embeddings.shape[1]}"
+                f"Metadata length ({len(metadata)}) must match "
+                f"number of embeddings ({len(embeddings)})"
             )
 
-        # Normalize embeddings for cosine similarity
-        faiss.normalize_L2(embeddings)
+        self._add_vectors(embeddings, start)
+        self.metadata.extend(metadata)
+        self._reset_metadata_views()
 
-        # Create index (IndexFlatIP for inner product = cosine similarity with normalized vectors)
-        self.index = faiss.IndexFlatIP(self.embedding_dimension)
-        self.index.add(embeddings.astype('float32'))
+    @abc.abstractmethod
+    def _create_empty_index(self, num_vectors: int):
+        """Create the backend index object."""
 
-        # Store metadata
-        if metadata is None:
-            self.metadata = list(range(len(embeddings)))
-        else:
-            if len(metadata) != len(embeddings):
-                raise ValueError(
-                    f"Metadata length ({len(metadata)}) must match "
-                    f"number of embeddings ({len(embeddings)})"
-                )
-            self.metadata = metadata
-
-    def search(self, query_embedding: np.ndarray, top_k: int = 5) -> List[Dict[str, Any]]:
+    @abc.abstractmethod
+    def _add_vectors(self, embeddings: np.ndarray, start: int):
+        """Add float32 vectors to the backend index with ids starting at ``start``."""
+
+    def _reset_metadata_views(self):
+        """Drop cached columns and per-type subsets after metadata changes."""
+        self._columns = {}
+        self._codes = {}
+        self._typed_subsets = {}
+
+    def metadata_column(self, field: str) -> np.ndarray:
+        """Return one metadata field for every row as an object array.
+
+        Columns are built once per field and reused, so callers can filter
+        hits with vectorized comparisons (e.g. ``column[ids] == "constraint"``).
+        Rows without the field (or non-dict metadata) read as "".
+
+        Args:
+            field: Metadata key, e.g. "type" or "category".
+
+        Returns:
+            Object array aligned with index ids.
+        """
+        column = self._columns.get(field)
+        if column is None:
+            column = np.empty(len(self.metadata), dtype=object)
+            column[:] = [
+                row.get(field, "") if isinstance(row, dict) else ""
+                for row in self.metadata
+            ]
+            self._columns[field] = column
+        return column
+
+    def metadata_codes(self, field: str) -> Tuple[np.ndarray, Dict[str, int]]:
+        """Return one metadata field encoded as int32 codes.
+
+        Codes are built once per field alongside the metadata and reused,
+        so native code (e.g. the re-ranker) can compare categories as ints.
+
+        Args:
+            field: Metadata key, e.g. "category".
+
+        Returns:
+            Tuple of (int32 codes aligned with index ids, value -> code map).
+        """
+        encoded = self._codes.get(field)
+        if encoded is None:
+            values, codes = np.unique(self.metadata_column(field).astype(str), return_inverse=True)
+            vocabulary = {value: code for code, value in enumerate(values.tolist())}
+            encoded = self._codes[field] = (codes.astype(np.int32), vocabulary)
+        return encoded
+
+    def search(self, query_embedding: np.ndarray, top_k: int = 5) -> Tuple[np.ndarray, np.ndarray]:
         """Search for similar embeddings.
 
         Args:
-            query_embedding: Query embedding vector of shape (embedding_dim,).
+            query_embedding: L2-normalized query vector of shape (embedding_dim,).
             top_k: Number of top results to return.
 
         Returns:
-            List of dictionaries with keys: score, metadata.
+            Tuple of (scores, ids) arrays, best first. Look up each hit's
+            metadata with ``retriever.metadata[id]``.
 
         Example:
             >>> query = embedder.embed("Age question constraint")
-            >>> results = retriever.search(query, top_k=5)
-            >>> for result in results:
-            ...     print(f"Score: {result['score']:.4f}, Metadata: {result['metadata']}")
+            >>> scores, ids = retriever.search(query, top_k=5)
+            >>> for score, idx in zip(scores, ids):
+            ...     print(f"Score: {score:.4f}, Metadata: {retriever.metadata[idx]}")
+        """
+        if query_embedding.shape != (self.embedding_dimension,):
+            raise ValueError(
+                f"Query embedding dimension mismatch: expected ({self.embedding_dimension},), "
+                f"got {query_embedding.shape}"
+            )
+
+        return self.search_batch(query_embedding.reshape(1, -1), top_k=top_k)[0]
+
+    def search_batch(self, queries: np.ndarray, top_k: int = 5) -> List[Tuple[np.ndarray, np.ndarray]]:
+        """Search for several query embeddings in a single index call.
+
+        Args:
+            queries: L2-normalized query embeddings of shape (n_queries, embedding_dim).
+            top_k: Number of top results to return per query.
+
+        Returns:
+            One (scores, ids) tuple per query row, as returned by ``search``.
+
+        Example:
+            >>> queries = embedder.embed_batch(["age constraint", "name question"])
+            >>> per_query = retriever.search_batch(queries, top_k=3)
+        """
+        if self.index is None:
+            raise ValueError("Index not built. Call build_index() first.")
+
+        if queries.ndim != 2 or queries.shape[1] != self.embedding_dimension:
+            raise ValueError(
+                f"Query embedding dimension mismatch: expected (n, {self.embedding_dimension}), "
+                f"got {queries.shape}"
+            )
+
+        # Query embeddings arrive L2-normalized from the embedder
+        queries = np.ascontiguousarray(queries, dtype='float32')
+        assert _is_normalized(queries), "Query embeddings must be L2-normalized"
+
+        scores, indices = self._search_index(queries, top_k)
+
+        # Keep valid ids only (-1 = no result)
+        valid = (indices >= 0) & (indices < len(self.metadata))
+        return [
+            (row_scores[row_valid], row_indices[row_valid])
+            for row_scores, row_indices, row_valid in zip(scores, indices, valid)
+        ]
+
+    def search_typed(
+        self,
+        query_embedding: np.ndarray,
+        doc_type: str,
+        top_k: int = 5
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Search only rows whose metadata ``type`` equals ``doc_type``.
+
+        Vectors for each type are pulled from the index once and cached, so
+        a typed query scans just that type's rows instead of the full corpus.
+
+        Args:
+            query_embedding: L2-normalized query vector of shape (embedding_dim,).
+            doc_type: Metadata type to search (e.g. "constraint", "question").
+            top_k: Number of top results to return.
+
+        Returns:
+            Tuple of (scores, ids) arrays, best first.
+
+        Example:
+            >>> scores, ids = retriever.search_typed(query, "constraint", top_k=3)
         """
         if self.index is None:
             raise ValueError("Index not built. Call build_index() first.")
@@ -105,24 +329,266 @@ class FAISSRetriever:
                 f"got {query_embedding.shape}"
             )
 
-        # Normalize query embedding
-        query_embedding = query_embedding.reshape(1, -1).astype('float32')
-        faiss.normalize_L2(query_embedding)
+        return self.search_typed_batch(query_embedding.reshape(1, -1), [doc_type], top_k=top_k)[0]
 
-        # Search
-        scores, indices = self.index.search(query_embedding, top_k)
+    def search_typed_batch(
+        self,
+        queries: np.ndarray,
+        doc_types: List[str],
+        top_k: int = 5
+    ) -> List[Tuple[np.ndarray, np.ndarray]]:
+        """Search each query row within its own document type in one pass.
 
-        # Format results
-        results = []
-        for score, idx in zip(scores[0], indices[0]):
-            if idx < len(self.metadata):  # Valid index
-                results.append({
-                    "score": float(score),
-                    "metadata": self.metadata[int(idx)]
-                })
+        The cached vectors of every requested type are stacked and scored
+        against all queries with a single matrix product; each row is then
+        ranked over its own type's slice only.
+
+        Args:
+            queries: L2-normalized query embeddings of shape (n_queries, embedding_dim).
+            doc_types: Metadata type to search for each query row.
+            top_k: Number of top results to return per query.
 
+        Returns:
+            One (scores, ids) tuple per query row, as returned by ``search_typed``.
+
+        Example:
+            >>> constraints, similar = retriever.search_typed_batch(
+            ...     queries, ["constraint", "question"], top_k=3
+            ... )
+        """
+        if self.index is None:
+            raise ValueError("Index not built. Call build_index() first.")
+
+        if queries.ndim != 2 or queries.shape[1] != self.embedding_dimension:
+            raise ValueError(
+                f"Query embedding dimension mismatch: expected (n, {self.embedding_dimension}), "
+                f"got {queries.shape}"
+            )
+        if len(doc_types) != len(queries):
+            raise ValueError(
+                f"Expected one doc_type per query row: got {len(doc_types)} for {len(queries)} rows"
+            )
+
+        # Row range of each distinct type within the stacked vectors
+        spans: Dict[str, Tuple[int, int]] = {}
+        blocks = []
+        offset = 0
+        for doc_type in doc_types:
+            if doc_type not in spans:
+                vectors = self._typed_subset(doc_type)[1]
+                spans[doc_type] = (offset, offset + len(vectors))
+                blocks.append(vectors)
+                offset += len(vectors)
+
+        stacked = (
+            np.concatenate(blocks)
+            if blocks else np.empty((0, self.embedding_dimension), dtype='float32')
+        )
+        all_scores = np.asarray(queries, dtype='float32') @ stacked.T
+
+        results = []
+        for row_scores, doc_type in zip(all_scores, doc_types):
+            start, stop = spans[doc_type]
+            if start == stop or top_k < 1:
+                results.append((np.empty(0, dtype='float32'), np.empty(0, dtype='int64')))
+                continue
+            scores = row_scores[start:stop]
+            k = min(top_k, stop - start)
+            top = np.argpartition(-scores, k - 1)[:k]
+            top = top[np.argsort(-scores[top])]
+            results.append((scores[top], self._typed_subset(doc_type)[0][top]))
         return results
 
+    def _typed_subset(self, doc_type: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Return (ids, vectors) of rows with the given type, pulled from the index once."""
+        subset = self._typed_subsets.get(doc_type)
+        if subset is None:
+            ids = np.flatnonzero(self.metadata_column("type") == doc_type)
+            vectors = (
+                np.asarray(self._reconstruct(ids), dtype='float32')
+                if len(ids) else np.empty((0, self.embedding_dimension), dtype='float32')
+            )
+            subset = self._typed_subsets[doc_type] = (ids, vectors)
+        return subset
+
+    @abc.abstractmethod
+    def _search_index(self, queries: np.ndarray, top_k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Return (scores, ids) arrays of shape (n_queries, top_k); -1 marks no result."""
+
+    @abc.abstractmethod
+    def _reconstruct(self, ids: np.ndarray) -> np.ndarray:
+        """Return stored vectors for the given ids, shape (len(ids), embedding_dim)."""
+
+    @abc.abstractmethod
+    def save_index(self, filepath: Union[str, Path]):
+        """Save the index and its metadata sidecar (``filepath`` has no extension)."""
+
+    @abc.abstractmethod
+    def load_index(self, filepath: Union[str, Path]):
+        """Load an index saved by ``save_index``."""
+
+    @abc.abstractmethod
+    def get_index_size(self) -> int:
+        """Return the number of vectors in the index."""
+
+    def _save_metadata(self, filepath: Path):
+        """Write the metadata sidecar next to the index.
+
+        Dict metadata is stored as a dictionary-encoded Parquet table when
+        pyarrow is installed; anything else falls back to pickle.
+        """
+        table = _metadata_to_table(self.metadata) if PYARROW_AVAILABLE else None
+        if table is not None:
+            pq.write_table(table, _metadata_path(filepath, ".parquet"))
+            _metadata_path(filepath).unlink(missing_ok=True)
+            return
+
+        _metadata_path(filepath, ".parquet").unlink(missing_ok=True)
+        with open(_metadata_path(filepath), "wb") as f:
+            pickle.dump(self.metadata, f)
+
+    def _load_metadata(self, filepath: Path):
+        """Read the metadata sidecar written by ``_save_metadata``."""
+        self._reset_metadata_views()
+        parquet_path = _metadata_path(filepath, ".parquet")
+        if PYARROW_AVAILABLE and parquet_path.exists():
+            self.metadata = _table_to_metadata(pq.read_table(parquet_path))
+            return
+
+        metadata_path = _metadata_path(filepath)
+        if not metadata_path.exists():
+            raise FileNotFoundError(f"Metadata file not found: {metadata_path}")
+
+        with open(metadata_path, "rb") as f:
+            self.metadata = pickle.load(f)
+
+    def is_built(self) -> bool:
+        """Check if the index has been built.
+
+        Returns:
+            True if index is built and ready for search.
+
+        Example:
+            >>> if not retriever.is_built():
+            ...     retriever.build_index(embeddings)
+        """
+        return self.index is not None
+
+
+class FAISSRetriever(BaseRetriever):
+    """FAISS-based vector retriever for fast similarity search.
+
+    Uses FAISS (Facebook AI Similarity Search) for efficient vector similarity
+    search. Supports saving and loading indexes for persistence. Indexes
+    store quantized vectors, so search scores are close approximations of
+    the exact cosine similarity.
+
+    Example:
+        >>> retriever = FAISSRetriever(embedding_dimension=384)
+        >>> embeddings = embedder.embed_batch(texts)  # normalized, shape (n, 384)
+        >>> retriever.build_index(embeddings, metadata=["doc_1", "doc_2", ...])
+        >>> scores, ids = retriever.search(query_embedding, top_k=5)
+    """
+
+    def __init__(self, embedding_dimension: int = 384, nprobe: int = 8):
+        """Initialize the FAISS retriever.
+
+        Args:
+            embedding_dimension: Dimension of embeddings (384 for all-MiniLM-L6-v2).
+            nprobe: Number of IVF cells scanned per query (IVF-PQ indexes only).
+
+        Raises:
+            ImportError: If faiss-cpu is not installed.
+        """
+        if not FAISS_AVAILABLE:
+            raise ImportError(
+                "faiss-cpu is not installed. "
+                "Install it with: pip install faiss-cpu"
+            )
+
+        super().__init__(embedding_dimension)
+        self.nprobe = nprobe
+
+        # OpenMP threads for index build and batched search. Torch encoding is
+        # capped separately (embedder.TORCH_MAX_THREADS); the two never overlap.
+        faiss.omp_set_num_threads(os.cpu_count() or 4)
+        self._gpu = False
+        self._gpu_resources = None  # Must outlive any GPU index built from it
+
+    def _create_empty_index(self, num_vectors: int):
+        """Create the FAISS index (inner product = cosine on normalized vectors)."""
+        return self._to_gpu(self._create_index(num_vectors))
+
+    def training_size(self, num_vectors: int) -> int:
+        """Number of embeddings the first ``add`` call should contain for training.
+
+        Small corpora train on everything; IVF-PQ trains on a sample of
+        64 vectors per inverted list.
+        """
+        if num_vectors < IVF_MIN_DOCUMENTS:
+            return num_vectors
+        return min(num_vectors, 64 * _ivf_nlist(num_vectors))
+
+    def _add_vectors(self, embeddings: np.ndarray, start: int):
+        """Train on the first chunk if needed, then add it."""
+        if not self.index.is_trained:
+            self.index.train(embeddings)
+        self.index.add(embeddings)
+
+    def _create_index(self, num_vectors: int):
+        """Create an empty FAISS index suited to the corpus size.
+
+        Small corpora use an exhaustive scan over 8-bit scalar-quantized
+        codes (a quarter of the float32 memory traffic). Large corpora use
+        IVF-PQ so each query scans only ``nprobe`` cells of compressed codes.
+
+        Args:
+            num_vectors: Number of embeddings that will be added.
+
+        Returns:
+            FAISS index (may require training before ``add``).
+        """
+        d = self.embedding_dimension
+        if num_vectors < IVF_MIN_DOCUMENTS or d % PQ_SUBVECTOR_DIM:
+            if _gpu_count() > 0:
+                # FAISS has no GPU flat scalar quantizer; exact flat search is fast there
+                return faiss.IndexFlatIP(d)
+            return faiss.IndexScalarQuantizer(
+                d, faiss.ScalarQuantizer.QT_8bit, faiss.METRIC_INNER_PRODUCT
+            )
+
+        nlist = _ivf_nlist(num_vectors)
+        m = d // PQ_SUBVECTOR_DIM
+        return faiss.index_factory(d, f"IVF{nlist},PQ{m}", faiss.METRIC_INNER_PRODUCT)
+
+    def _to_gpu(self, index):
+        """Move a CPU index to GPU 0 when CUDA FAISS is available; else return it."""
+        self._gpu = False
+        if _gpu_count() == 0:
+            return index
+        try:
+            if self._gpu_resources is None:
+                self._gpu_resources = faiss.StandardGpuResources()
+            gpu_index = faiss.index_cpu_to_gpu(self._gpu_resources, 0, index)
+        except RuntimeError:
+            # Index type not implemented on GPU
+            return index
+        self._gpu = True
+        return gpu_index
+
+    def _search_index(self, queries: np.ndarray, top_k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Search the FAISS index."""
+        if hasattr(self.index, "nprobe"):
+            self.index.nprobe = self.nprobe
+        return self.index.search(queries, top_k)
+
+    def _reconstruct(self, ids: np.ndarray) -> np.ndarray:
+        """Decode stored (possibly quantized) vectors from the FAISS index."""
+        index = faiss.index_gpu_to_cpu(self.index) if self._gpu else self.index
+        if hasattr(index, "make_direct_map"):
+            index.make_direct_map()  # IVF indexes need an id -> list map to reconstruct
+        return index.reconstruct_batch(ids.astype('int64'))
+
     def save_index(self, filepath: Union[str, Path]):
         """Save FAISS index and metadata to disk.
 
@@ -131,7 +597,7 @@ class FAISSRetriever:
 
         Example:
             >>> retriever.save_index("data/embeddings/knowledge_base")
-            # Saves: knowledge_base.faiss and knowledge_base_metadata.pkl
+            # Saves: knowledge_base.faiss and knowledge_base_metadata.parquet (or .pkl)
         """
         if self.index is None:
             raise ValueError("No index to save. Build index first.")
@@ -140,12 +606,10 @@ class FAISSRetriever:
 
         # Save FAISS index
         index_path = filepath.with_suffix(".faiss")
-        faiss.write_index(self.index, str(index_path))
+        cpu_index = faiss.index_gpu_to_cpu(self.index) if self._gpu else self.index
+        faiss.write_index(cpu_index, str(index_path))
 
-        # Save metadata
-        metadata_path = filepath.with_suffix("_metadata.pkl")
-        with open(metadata_path, "wb") as f:
-            pickle.dump(self.metadata, f)
+        self._save_metadata(filepath)
 
     def load_index(self, filepath: Union[str, Path]):
         """Load FAISS index and metadata from disk.
@@ -163,15 +627,11 @@ class FAISSRetriever:
         if not index_path.exists():
             raise FileNotFoundError(f"Index file not found: {index_path}")
 
-        self.index = faiss.read_index(str(index_path))
+        cpu_index = faiss.read_index(str(index_path))
+        self.embedding_dimension = cpu_index.d
+        self.index = self._to_gpu(cpu_index)
 
-        # Load metadata
-        metadata_path = filepath.with_suffix("_metadata.pkl")
-        if not metadata_path.exists():
-            raise FileNotFoundError(f"Metadata file not found: {metadata_path}")
-
-        with open(metadata_path, "rb") as f:
-            self.metadata = pickle.load(f)
+        self._load_metadata(filepath)
 
     def get_index_size(self) -> int:
         """Get the number of embeddings in the index.
@@ -188,58 +648,93 @@ class FAISSRetriever:
             return 0
         return self.index.ntotal
 
-    def is_built(self) -> bool:
-        """Check if the index has been built.
 
-        Returns:
-            True if index is built and ready for search.
+class USearchRetriever(BaseRetriever):
+    """USearch-based exact retriever for small knowledge bases.
 
-        Example:
-            >>> if not retriever.is_built():
-            ...     retriever.build_index(embeddings)
+    Runs brute-force inner-product search with SimSIMD float16 kernels,
+    which beats a FAISS flat scan for corpora below ``USEARCH_MAX_DOCUMENTS``.
+    Shares the ``FAISSRetriever`` API and metadata sidecar format.
+
+    Example:
+        >>> retriever = USearchRetriever(embedding_dimension=384)
+        >>> retriever.build_index(embeddings, metadata=["doc_1", "doc_2", ...])
+        >>> scores, ids = retriever.search(query_embedding, top_k=5)
+    """
+
+    def __init__(self, embedding_dimension: int = 384):
+        """Initialize the USearch retriever.
+
+        Args:
+            embedding_dimension: Dimension of embeddings (384 for all-MiniLM-L6-v2).
+
+        Raises:
+            ImportError: If usearch is not installed.
         """
-        return self.index is not None
+        if not USEARCH_AVAILABLE:
+            raise ImportError(
+                "usearch is not installed. "
+                "Install it with: pip install usearch"
+            )
+
+        super().__init__(embedding_dimension)
+
+    def _create_empty_index(self, num_vectors: int):
+        """Create an empty inner-product index with float16 storage."""
+        return USearchIndex(ndim=self.embedding_dimension, metric="ip", dtype="f16")
+
+    def _add_vectors(self, embeddings: np.ndarray, start: int):
+        """Add vectors keyed by their row ids."""
+        self.index.add(np.arange(start, start + len(embeddings)), embeddings)
+
+    def _search_index(self, queries: np.ndarray, top_k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Run exact search and convert USearch distances to similarity scores."""
+        matches = self.index.search(queries, top_k, exact=True)
+        keys = np.atleast_2d(matches.keys).astype('int64')
+        distances = np.atleast_2d(matches.distances)
+        counts = np.atleast_1d(getattr(matches, "counts", keys.shape[1]))
+
+        # Mask slots beyond each row's match count; "ip" distance is 1 - dot
+        missing = np.arange(keys.shape[1])[None, :] >= counts[:, None]
+        keys[missing] = -1
+        return 1.0 - distances, keys
+
+    def _reconstruct(self, ids: np.ndarray) -> np.ndarray:
+        """Fetch stored vectors from the USearch index."""
+        return np.vstack(self.index.get(ids, dtype=np.float32))
+
+    def save_index(self, filepath: Union[str, Path]):
+        """Save USearch index and metadata to disk.
+
+        Args:
+            filepath: Path to save the index (without extension).
+        """
+        if self.index is None:
+            raise ValueError("No index to save. Build index first.")
 
+        filepath = Path(filepath)
+        self.index.save(str(filepath.with_suffix(".usearch")))
+        self._save_metadata(filepath)
+
+    def load_index(self, filepath: Union[str, Path]):
+        """Load USearch index and metadata from disk.
+
+        Args:
+            filepath: Path to the index file (without extension).
+        """
+        filepath = Path(filepath)
 
-if __name__ == "__main__":
-    # Test the retriever
-    print("Testing FAISSRetriever...")
-
-    # Create sample data
-    np.random.seed(42)
-    num_docs = 100
-    embedding_dim = 384
-
-    embeddings = np.random.rand(num_docs, embedding_dim)
-    metadata = [f"doc_{i}" for i in range(num_docs)]
-
-    # Build index
-    retriever = FAISSRetriever(embedding_dimension=embedding_dim)
-    retriever.build_index(embeddings, metadata)
-    print(f"[OK] Built index with {retriever.get_index_size()} embeddings")
-
-    # Test search
-    query = embeddings[0]  # Use first embedding as query
-    results = retriever.search(query, top_k=5)
-    print(f"\n[OK] Search returned {len(results)} results:")
-    for i, result in enumerate(results[:3]):
-        print(f"  {i+1}. Score: {result['score']:.4f}, Metadata: {result['metadata']}")
-
-    # Test save/load
-    import tempfile
-    with tempfile.TemporaryDirectory() as tmpdir:
-        save_path = Path(tmpdir) / "test_index"
-        retriever.save_index(save_path)
-        print(f"\n[OK] Saved index to: {save_path}")
-
-        # Create new retriever and load
-        new_retriever = FAISSRetriever(embedding_dimension=embedding_dim)
-        new_retriever.load_index(save_path)
-        print(f"[OK] Loaded index with {new_retriever.get_index_size()} embeddings")
-
-        # Verify search works
-        new_results = new_retriever.search(query, top_k=5)
-        assert len(results) == len(new_results), "Search results length mismatch"
-        print("[OK] Loaded index produces same results")
-
-    print("\n[OK] All tests passed!")
+        index_path = filepath.with_suffix(".usearch")
+        if not index_path.exists():
+            raise FileNotFoundError(f"Index file not found: {index_path}")
+
+        self.index = USearchIndex.restore(str(index_path))
+        self.embedding_dimension = self.index.ndim
+
+        self._load_metadata(filepath)
+
+    def get_index_size(self) -> int:
+        """Get the number of embeddings in the index."""
+        if self.index is None:
+            return 0
+        return len(self.index)
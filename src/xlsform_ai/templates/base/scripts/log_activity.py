@@ -1,59 +1,268 @@
 """Activity logger for XLSForm AI projects."""
 
+import atexit
 import base64
+import contextlib
 import io
 import json
+import mmap
+import os
+import shutil
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
 # CRITICAL: Add scripts directory to Python path for sibling imports
 # This allows the script to find sibling modules whether run from project root or scripts dir
 _scripts_dir = Path(__file__).parent.resolve()
 if str(_scripts_dir) not in sys.path:
     sys.path.insert(0, str(_scripts_dir))
 
+# Sibling modules are optional so the logger still works from a partial copy
+try:
+    from config import ProjectConfig
+except ImportError:
+    ProjectConfig = None
+
+try:
+    from author_utils import get_detected_author, get_effective_location
+except ImportError:
+    get_detected_author = None
+    get_effective_location = None
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 
 LOG_FILE_TAG = "XLSFORM_AI_ACTIVITY_LOG"
 LOG_VERSION = "1.0"
 
+# Tag as bytes, matched against the raw header of candidate log files
+LOG_FILE_TAG_BYTES = LOG_FILE_TAG.encode('ascii')
+LOG_HEADER_BYTES = 512
+
+# Markers around the JSON payload embedded in the HTML log
+DATA_START_MARKER = b"<!-- XLSFORM_AI_DATA_START -->"
+DATA_END_MARKER = b"<!-- XLSFORM_AI_DATA_END -->"
+
+# Buffer size for writing the HTML log
+WRITE_BUFFER_SIZE = 64 * 1024
+
+# Queued entries that trigger an HTML rebuild before exit
+DEFAULT_RENDER_BATCH = 50
+
+# Bounding box for the header logo (width, height)
+LOGO_MAX_SIZE = (480, 96)
+
+# Fields backfilled on entries written by older versions of the logger
+_ENTRY_DEFAULTS = {
+    "action_type": "",
+    "description": "",
+    "details": "",
+    "author": "Unknown",
+    "location": "Unknown",
+}
+
+# Translation table for escaping text interpolated into HTML
+_HTML_ESCAPE = str.maketrans({
+    "&": "&amp;",
+    "<": "&lt;",
+    ">": "&gt;",
+    '"': "&quot;",
+    "'": "&#x27;",
+})
+
+# ProjectConfig per project directory with the config file mtime_ns it was
+# read at (None if absent), shared by every logger in the process
+_CONFIG_CACHE: Dict[Path, Tuple[Optional[int], "ProjectConfig"]] = {}
+
+# Resolved activity log path per project directory
+_LOG_PATH_CACHE: Dict[Path, Path] = {}
+
+# Logger that will re-render each HTML log whose store has unrendered entries,
+# and how many entries that is; shared by every logger in the process
+_STALE_LOGS: Dict[Path, "ActivityLogger"] = {}
+_UNRENDERED_COUNTS: Dict[Path, int] = {}
+_exit_flush_registered = False
+
+
+def _flush_stale_logs() -> None:
+    """Re-render every HTML log left behind its entry store (runs at exit)."""
+    for logger in list(_STALE_LOGS.values()):
+        logger.flush_html()
+
+
+# Heavy optional modules, imported on first use (settings_utils pulls in openpyxl)
+_rich_console = None
+_settings_utils = None
+_pil_image = None
+
+
+def _get_console():
+    """Return a shared Rich console, importing Rich on first use."""
+    global _rich_console
+    if _rich_console is None:
+        from rich.console import Console
+        _rich_console = Console()
+    return _rich_console
+
+
+def _get_settings_utils():
+    """Return the settings_utils module, or None if it cannot be imported."""
+    global _settings_utils
+    if _settings_utils is None:
+        try:
+            import settings_utils as module
+        except ImportError:
+            module = False  # Remember the failure instead of retrying
+        _settings_utils = module
+    return _settings_utils or None
+
+
+def _get_pil_image():
+    """Return PIL.Image, importing Pillow on first use."""
+    global _pil_image
+    if _pil_image is None:
+        from PIL import Image
+        _pil_image = Image
+    return _pil_image
+
+
+def _dumpb(obj) -> bytes:
+    """Serialize to compact UTF-8 JSON bytes, using orjson when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def _loads(data):
+    """Parse JSON from str or bytes, using orjson when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _iter_payload(data: dict) -> Iterator[bytes]:
+    """Serialize the embedded log payload to UTF-8 one entry at a time.
+
+    The payload is machine-read, so it is written compact; set
+    XLSFORM_LOG_DEBUG=1 to indent it for inspection.
+    """
+    if os.environ.get("XLSFORM_LOG_DEBUG") == "1":
+        yield json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+        return
+
+    entries = data.get("entries", [])
+    header = _dumpb({key: value for key, value in data.items() if key != "entries"})
+    yield b'{"entries":[' if header == b'{}' else header[:-1] + b',"entries":['
+    for i, entry in enumerate(entries):
+        yield (b',' + _dumpb(entry)) if i else _dumpb(entry)
+    yield b']}'
+
 
 class ActivityLogger:
     """Logger for tracking XLSForm AI activities."""
 
-    def __init__(self, project_dir: Optional[Path] = None):
+    # Logo data URI per (resolved logo path, st_mtime_ns) of its source file
+    _LOGO_CACHE: Dict[Tuple[Path, int], str] = {}
+
+    # Template (head, tail) split at {DATA}, or None if the file is missing
+    _TEMPLATE_CACHE: Dict[Path, Optional[Tuple[bytes, bytes]]] = {}
+
+    def __init__(
+        self,
+        project_dir: Optional[Path] = None,
+        auto_flush: bool = False,
+        fsync: bool = False
+    ):
         """Initialize logger.
 
         Args:
             project_dir: Project directory. Defaults to current working directory.
+            auto_flush: Rebuild the HTML log after every entry instead of once
+                at exit. Only needed when the page must stay live.
+            fsync: Flush the HTML log to disk before it replaces the old one.
         """
         self.project_dir = Path(project_dir) if project_dir else Path.cwd()
 
+        # One shared config for every lookup made by this logger
+        self._config = self._get_config()
+
         # Try to load project name from config
-        try:
-            from config import ProjectConfig
-            config = ProjectConfig(self.project_dir)
-            self.project_name = config.get_project_name()
-        except:
-            self.project_name = self.project_dir.name
+        self.project_name = self.project_dir.name
+        config = self._config
+        if config is not None:
+            try:
+                self.project_name = config.get_project_name()
+            except Exception:
+                pass
 
         self.log_file = self._find_log_file()
 
+        # Append-only entry store; the HTML log is regenerated from it
+        self._jsonl_path = self.log_file.with_suffix('.jsonl')
+        self._log_key = self.log_file.resolve()  # Identity of the log across loggers
+        self.auto_flush = auto_flush
+        self.fsync = fsync
+        self._data_cache: Optional[dict] = None  # Last folded entry store
+        self._data_cache_key: Optional[Tuple[int, int]] = None  # (size, mtime_ns) it was read at
+        self._render_every = DEFAULT_RENDER_BATCH
+        if config is not None:
+            try:
+                self._render_every = config.get_log_render_batch()
+            except Exception:
+                pass
+        if not self._jsonl_path.exists() and self.log_file.exists():
+            self._migrate_html_log()
+
         # Store effective author for this session
         self._effective_author = self._get_effective_author()
         self._effective_location = self._get_effective_location()
         self._xlsform_path = self._get_xlsform_path()
 
+        # Settings read from the XLSForm, reused until its mtime changes
+        self._settings_mtime: Optional[int] = None
+        self._settings_cache: Dict[str, str] = {}
+        self._missing_settings_mtime: Optional[int] = None
+        self._missing_settings: List[str] = []
+        self._warned_this_session = False
+        self._warned_corrupt_store = False
+
+    def _get_config(self) -> Optional["ProjectConfig"]:
+        """Return the ProjectConfig for this project directory, reread when xlsform-ai.json changes.
+
+        Returns:
+            ProjectConfig, or None if the config module is not available
+        """
+        if ProjectConfig is None:
+            return None
+        try:
+            mtime_ns = (self.project_dir / "xlsform-ai.json").stat().st_mtime_ns
+        except OSError:
+            mtime_ns = None
+
+        # Reuse the cached config only while the file is unchanged on disk
+        cached = _CONFIG_CACHE.get(self.project_dir)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+        config = ProjectConfig(self.project_dir)
+        _CONFIG_CACHE[self.project_dir] = (mtime_ns, config)
+        return config
+
     def _get_xlsform_path(self) -> Optional[Path]:
         """Get XLSForm file path for reading settings metadata."""
-        try:
-            from config import ProjectConfig
-            config = ProjectConfig(self.project_dir)
-            return config.get_full_xlsform_path()
-        except Exception:
-            default_path = self.project_dir / "survey.xlsx"
-            return default_path if default_path.exists() else None
+        config = self._config
+        if config is not None:
+            try:
+                return config.get_full_xlsform_path()
+            except Exception:
+                pass
+
+        default_path = self.project_dir / "survey.xlsx"
+        return default_path if default_path.exists() else None
 
     def _get_effective_author(self) -> str:
         """Get effective author name with intelligent fallback.
@@ -67,99 +276,161 @@ class ActivityLogger:
             Author name string
         """
         # Try to get from project config first
-        try:
-            from config import ProjectConfig
-            config = ProjectConfig(self.project_dir)
-            author = config.get_effective_author()
-            if author:
-                return author
-        except Exception:
-            pass
+        config = self._config
+        if config is not None:
+            try:
+                author = config.get_effective_author()
+                if author:
+                    return author
+            except Exception:
+                pass
 
         # Fall back to detection utilities
-        try:
-            from author_utils import get_detected_author
-            return get_detected_author()
-        except Exception:
-            return "User"
+        if get_detected_author is not None:
+            try:
+                return get_detected_author()
+            except Exception:
+                pass
+        return "User"
 
     def _find_log_file(self) -> Path:
         """Find existing log file or determine new log file path.
 
         Ensures only ONE activity log file exists per project.
         If multiple are found, keeps the most recent and deletes the others.
+        The result is remembered per project and reused while the log or its
+        entry store still exists.
 
         Returns:
             Path to log file
         """
-        # Get the configured log file name
-        try:
-            from config import ProjectConfig
-            config = ProjectConfig(self.project_dir)
-            log_filename = config.get_activity_log_file()
-        except Exception:
-            # Fallback to default if config is not available
-            log_filename = "activity_log.html"
+        # Get the configured log file name, falling back to the default
+        log_filename = "activity_log.html"
+        config = self._config
+        if config is not None:
+            try:
+                log_filename = config.get_activity_log_file()
+            except Exception:
+                pass
 
+        # Reuse the path resolved by an earlier logger for this project,
+        # unless the log was since deleted or moved
+        cached = _LOG_PATH_CACHE.get(self.project_dir)
+        if (
+            cached is not None
+            and cached.name == log_filename
+            and (cached.exists() or cached.with_suffix('.jsonl').exists())
+        ):
+            return cached
+
+        log_path = self._resolve_log_file(log_filename)
+        _LOG_PATH_CACHE[self.project_dir] = log_path
+        return log_path
+
+    def _resolve_log_file(self, log_filename: str) -> Path:
+        """Locate the project's activity log on disk, consolidating duplicates.
+
+        Args:
+            log_filename: Configured log file name
+
+        Returns:
+            Path to log file
+        """
         log_path = self.project_dir / log_filename
 
-        # Find all existing activity log files (including old ones with different names)
-        existing_logs = []
-        for file in self.project_dir.glob("*.html"):
-            try:
-                with open(file, 'r', encoding='utf-8') as f:
-                    # Check first 1000 chars for tag
-                    content = f.read(1000)
-                    if LOG_FILE_TAG in content:
-                        existing_logs.append(file)
-            except:
-                pass
+        # Common case: the configured log already exists
+        if self._has_log_tag(log_path):
+            return log_path
 
-        if not existing_logs:
+        # Find all existing activity log files (including old ones with different names)
+        matches = []
+        with os.scandir(self.project_dir) as entries:
+            for entry in entries:
+                if (entry.name.endswith('.html')
+                        and entry.is_file(follow_symlinks=False)
+                        and self._has_log_tag(entry.path)):
+                    matches.append(entry)
+
+        if not matches:
             # No existing log found, return the new file path
             return log_path
 
-        # Sort existing logs by modification time (most recent first)
-        existing_logs.sort(key=lambda f: f.stat().st_mtime, reverse=True)
+        # Single match: no need to stat and sort
+        if len(matches) == 1:
+            most_recent_log = Path(matches[0].path)
+            if most_recent_log.name == log_filename:
+                return most_recent_log
+            return self._rename_log(most_recent_log, log_path)
+
+        # Sort existing logs by modification time (most recent first); DirEntry
+        # caches its stat result, and on Windows it comes with the directory listing
+        matches.sort(key=lambda e: e.stat(follow_symlinks=False).st_mtime, reverse=True)
+        existing_logs = [Path(entry.path) for entry in matches]
 
         # Keep the most recent log file
         most_recent_log = existing_logs[0]
 
         # If the most recent log is not named according to config, rename it
         if most_recent_log.name != log_filename:
-            try:
-                most_recent_log.rename(log_path)
-                return log_path
-            except Exception:
-                # If rename fails, use the most recent log as-is
-                return most_recent_log
+            return self._rename_log(most_recent_log, log_path)
 
-        # Delete any older log files (there should only be one now)
+        # Delete any older log files and their entry stores (there should only be one now)
         for old_log in existing_logs[1:]:
-            try:
-                if old_log != log_path and old_log.exists():
+            if old_log != log_path:
+                with contextlib.suppress(OSError):
                     old_log.unlink()
-            except Exception:
-                pass  # Ignore errors when cleaning up old logs
+                    old_log.with_suffix('.jsonl').unlink(missing_ok=True)
 
         return log_path
 
-    def _get_effective_location(self) -> str:
-        """Get effective location label for activity logging."""
+    @staticmethod
+    def _rename_log(current: Path, log_path: Path) -> Path:
+        """Rename a log (and its JSONL entry store) to the configured name.
+
+        Returns:
+            The new path, or the current one if the rename fails
+        """
         try:
-            from config import ProjectConfig
-            config = ProjectConfig(self.project_dir)
-            location = config.get_location()
-            if location:
-                return location
-        except Exception:
-            pass
+            current.rename(log_path)
+        except OSError:
+            # If rename fails, use the log as-is
+            return current
+
+        with contextlib.suppress(OSError):
+            current.with_suffix('.jsonl').rename(log_path.with_suffix('.jsonl'))
+        return log_path
 
+    @staticmethod
+    def _has_log_tag(path: Union[str, Path]) -> bool:
+        """Check whether the file header carries the activity log tag."""
         try:
-            from author_utils import get_effective_location
-            return get_effective_location(self.project_dir)
-        except Exception:
-            return "Unknown"
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            return False
+        try:
+            return LOG_FILE_TAG_BYTES in os.read(fd, LOG_HEADER_BYTES)
+        except OSError:
+            return False
+        finally:
+            os.close(fd)
+
+    def _get_effective_location(self) -> str:
+        """Get effective location label for activity logging."""
+        config = self._config
+        if config is not None:
+            try:
+                location = config.get_location()
+                if location:
+                    return location
+            except Exception:
+                pass
+
+        if get_effective_location is not None:
+            try:
+                return get_effective_location(self.project_dir)
+            except Exception:
+                pass
+        return "Unknown"
 
     def log_action(self, action_type: str, description: str, details: str = "",
                    author: Optional[str] = None, location: Optional[str] = None):
@@ -172,16 +443,16 @@ class ActivityLogger:
             author: Author name (optional)
             location: Author location (optional)
         """
-        # Load existing data
-        data = self._load_log_data()
-        self._update_form_settings_metadata(data)
         self._warn_if_missing_settings()
 
+        # One clock read; date and time are slices of the ISO timestamp
+        timestamp = datetime.now().isoformat()
+
         # Add new entry
         entry = {
-            "timestamp": datetime.now().isoformat(),
-            "date": datetime.now().strftime("%Y-%m-%d"),
-            "time": datetime.now().strftime("%H:%M:%S"),
+            "timestamp": timestamp,
+            "date": timestamp[:10],
+            "time": timestamp[11:19],
             "action_type": action_type,
             "description": description,
             "details": details,
@@ -189,31 +460,92 @@ class ActivityLogger:
             "location": location or self._effective_location or "Unknown"
         }
 
-        data["entries"].append(entry)
-        data["total_actions"] += 1
-        data["last_updated"] = datetime.now().isoformat()
+        # The entry is durable once appended; only the HTML render is deferred,
+        # to exit or every _render_every entries for long-running callers
+        self._append_entry(entry)
+        unrendered = _UNRENDERED_COUNTS.get(self._log_key, 0) + 1
+        _UNRENDERED_COUNTS[self._log_key] = unrendered
+        _STALE_LOGS[self._log_key] = self
+        if self.auto_flush or unrendered >= self._render_every:
+            self.flush_html()
+        else:
+            global _exit_flush_registered
+            if not _exit_flush_registered:
+                atexit.register(_flush_stale_logs)
+                _exit_flush_registered = True
+
+        return self.log_file
+
+    def flush_html(self) -> Path:
+        """Rebuild the HTML log if entries were appended since it was last rendered.
+
+        Returns:
+            Path to the HTML log file
+        """
+        if _STALE_LOGS.pop(self._log_key, None) is not None:
+            _UNRENDERED_COUNTS.pop(self._log_key, None)
+            self.regenerate()
+        return self.log_file
 
-        # Save updated log
-        self._save_log(data)
+    def _append_entry(self, entry: dict) -> None:
+        """Append one entry to the JSONL store."""
+        cache_current = self._data_cache is not None and self._data_cache_key == self._store_key()
+        with open(self._jsonl_path, 'ab') as f:
+            f.write(_dumpb(entry) + b'\n')
+
+        # Extend the cached data in place rather than re-reading what was just written
+        if cache_current:
+            data = self._data_cache
+            if not data["entries"]:
+                data["created"] = entry["timestamp"]
+            data["entries"].append(entry)
+            data["total_actions"] = len(data["entries"])
+            data["last_updated"] = entry["timestamp"]
+            self._data_cache_key = self._store_key()
+
+    def _store_key(self) -> Optional[Tuple[int, int]]:
+        """Return (size, mtime_ns) of the JSONL store, or None if it does not exist."""
+        try:
+            st = os.stat(self._jsonl_path)
+        except OSError:
+            return None
+        return st.st_size, st.st_mtime_ns
 
+    def regenerate(self) -> Path:
+        """Rebuild the HTML activity log from the JSONL entry store.
+
+        Returns:
+            Path to the HTML log file
+        """
+        data = self._load_log_data()
+        self._update_form_settings_metadata(data)
+        self._save_log(self._iter_html(data))
         return self.log_file
 
     def _warn_if_missing_settings(self) -> None:
         """Warn once per session if required settings are missing."""
-        try:
-            from settings_utils import missing_required_settings
-        except Exception:
+        if self._warned_this_session:
             return
 
-        if not self._xlsform_path or not self._xlsform_path.exists():
+        mtime = self._xlsform_mtime()
+        if mtime is None:
             return
 
-        missing = missing_required_settings(self._xlsform_path)
+        # Re-check only when the workbook changed since the last check
+        if mtime != self._missing_settings_mtime:
+            settings_utils = _get_settings_utils()
+            if settings_utils is None:
+                return
+            self._missing_settings = settings_utils.missing_required_settings(self._xlsform_path)
+            # The check may write a default version formula, so stat afterwards
+            self._missing_settings_mtime = self._xlsform_mtime()
+
+        missing = self._missing_settings
         if missing:
+            self._warned_this_session = True
             missing_list = ", ".join(missing)
             try:
-                from rich.console import Console
-                console = Console()
+                console = _get_console()
                 console.print("")
                 console.print(f"[bold white on red] ACTION REQUIRED [/bold white on red] Missing required settings: {missing_list}")
                 console.print(
@@ -237,71 +569,175 @@ class ActivityLogger:
 
     def _update_form_settings_metadata(self, data: dict) -> None:
         """Update log metadata with current form title and ID."""
-        try:
-            from settings_utils import read_form_settings
-        except Exception:
+        mtime = self._xlsform_mtime()
+        if mtime is None:
             return
 
-        if not self._xlsform_path or not self._xlsform_path.exists():
-            return
+        if mtime != self._settings_mtime:
+            settings_utils = _get_settings_utils()
+            if settings_utils is None:
+                return
+            self._settings_cache = settings_utils.read_form_settings(self._xlsform_path)
+            self._settings_mtime = mtime
 
-        settings = read_form_settings(self._xlsform_path)
+        settings = self._settings_cache
         data["form_title"] = settings.get("form_title", "")
         data["form_id"] = settings.get("form_id", "")
         data["form_version"] = settings.get("version", "")
 
-    def _load_log_data(self) -> dict:
-        """Load existing log data or create new structure.
+    def _xlsform_mtime(self) -> Optional[int]:
+        """Return the XLSForm modification time in ns, or None if it is missing."""
+        if not self._xlsform_path:
+            return None
+        try:
+            return self._xlsform_path.stat().st_mtime_ns
+        except OSError:
+            return None
 
-        Returns:
-            dict with log data
-        """
-        default_data = {
+    def _default_log_data(self) -> dict:
+        """Create an empty log data structure."""
+        now = datetime.now().isoformat()
+        return {
             "version": LOG_VERSION,
             "tag": LOG_FILE_TAG,
             "project_name": self.project_name,
             "form_title": "",
             "form_id": "",
             "form_version": "",
-            "created": datetime.now().isoformat(),
-            "last_updated": datetime.now().isoformat(),
+            "created": now,
+            "last_updated": now,
             "total_actions": 0,
             "entries": []
         }
 
-        if not self.log_file.exists():
-            return default_data
+    def _load_log_data(self) -> dict:
+        """Load log data by folding over the JSONL entry store.
+
+        Returns:
+            dict with log data
+        """
+        # Reuse the last fold while the store is unchanged on disk
+        key = self._store_key()
+        if key is not None and key == self._data_cache_key:
+            return self._data_cache
+
+        data = self._default_log_data()
 
+        entries = []
+        skipped = 0
         try:
-            # Try to extract JSON data from existing HTML
-            with open(self.log_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-                # Find JSON data between specific markers
-                start_marker = "<!-- XLSFORM_AI_DATA_START -->"
-                end_marker = "<!-- XLSFORM_AI_DATA_END -->"
-
-                start_idx = content.find(start_marker)
-                if start_idx > 0:
-                    start_idx += len(start_marker)
-                    end_idx = content.find(end_marker, start_idx)
-                    if end_idx > start_idx:
-                        json_str = content[start_idx:end_idx].strip()
-                        return json.loads(json_str)
-        except:
-            pass
+            with open(self._jsonl_path, 'rb') as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        entry = _loads(line)
+                    except ValueError:
+                        skipped += 1  # Torn line from an interrupted write
+                        continue
+                    if not isinstance(entry, dict):
+                        skipped += 1
+                        continue
+                    timestamp = entry.setdefault("timestamp", "")
+                    entry.setdefault("date", timestamp[:10])
+                    entry.setdefault("time", timestamp[11:19])
+                    for key, default in _ENTRY_DEFAULTS.items():
+                        entry.setdefault(key, default)
+                    entries.append(entry)
+        except FileNotFoundError:
+            return data
+
+        if skipped and not self._warned_corrupt_store:
+            self._warned_corrupt_store = True
+            print(
+                f"Warning: skipped {skipped} unreadable line(s) in {self._jsonl_path.name}",
+                file=sys.stderr,
+            )
+
+        data["entries"] = entries
+        data["total_actions"] = len(entries)
+        if entries:
+            data["created"] = entries[0]["timestamp"] or data["created"]
+            data["last_updated"] = entries[-1]["timestamp"] or data["last_updated"]
+        self._data_cache, self._data_cache_key = data, key
+        return data
+
+    def _migrate_html_log(self) -> None:
+        """Seed the JSONL entry store from a log written before it existed."""
+        data = self._load_html_data()
+        if not data or not data.get("entries"):
+            return
 
-        return default_data
+        with open(self._jsonl_path, 'wb') as f:
+            f.writelines(_dumpb(entry) + b'\n' for entry in data["entries"])
 
-    def _save_log(self, data: dict):
-        """Save log data as formatted HTML file.
+    def _load_html_data(self) -> Optional[dict]:
+        """Extract the JSON payload embedded in the HTML log.
 
-        Args:
-            data: Log data dictionary
+        Returns:
+            dict with log data, or None if the log has no readable payload
         """
-        html = self._generate_html(data)
+        if not self.log_file.exists():
+            return None
 
-        with open(self.log_file, 'w', encoding='utf-8') as f:
-            f.write(html)
+        try:
+            # Scan the mapped bytes for the markers; only the payload is copied out
+            with open(self.log_file, 'rb') as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return None
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    payload = self._extract_payload(mm)
+
+            if payload is not None:
+                return _loads(payload)
+        except OSError:
+            pass
+        except ValueError:
+            # Keep a copy: the next save replaces the page with the new entries only
+            backup_path = self.log_file.with_suffix(self.log_file.suffix + '.bak')
+            with contextlib.suppress(OSError):
+                shutil.copy2(self.log_file, backup_path)
+            print(
+                f"Warning: could not read the entries embedded in {self.log_file.name}; "
+                f"a copy was saved to {backup_path.name}",
+                file=sys.stderr,
+            )
+
+        return None
+
+    @staticmethod
+    def _extract_payload(content: Union[bytes, mmap.mmap]) -> Optional[bytes]:
+        """Return the bytes between the data markers, or None if absent."""
+        end_idx = content.rfind(DATA_END_MARKER)
+        if end_idx < 0:
+            return None
+        start_idx = content.rfind(DATA_START_MARKER, 0, end_idx)
+        if start_idx < 0:
+            return None
+        return content[start_idx + len(DATA_START_MARKER):end_idx].strip()
+
+    def _save_log(self, chunks: Iterable[bytes]):
+        """Write HTML chunks to a temp file, then atomically replace the log.
+
+        A crash mid-write leaves the previous log intact instead of a
+        truncated page.
+
+        Args:
+            chunks: UTF-8 encoded HTML fragments, in document order
+        """
+        tmp_path = self.log_file.with_suffix(self.log_file.suffix + '.tmp')
+        try:
+            with open(tmp_path, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+                for chunk in chunks:
+                    f.write(chunk)
+                if self.fsync:
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(tmp_path, self.log_file)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
 
     def _get_base64_logo(self) -> str:
         """Get ARCED Foundation logo as base64-encoded data URI.
@@ -312,47 +748,65 @@ class ActivityLogger:
         # Try to load logo from branding folder
         logo_paths = [
             Path("J:/My Drive/ARCED International/Branding/arced-int.png"),
-            Path(__file__).parent.parent / "arced-int.png",
+            _scripts_dir.parent / "arced-int.png",
             self.project_dir / "arced-int.png",
         ]
 
         for logo_path in logo_paths:
             try:
-                if logo_path.exists():
-                    # Import PIL here to avoid dependency if not available
-                    try:
-                        from PIL import Image
-                        img = Image.open(logo_path)
-
-                        # Resize to reasonable header size (max height 96px)
-                        max_height = 96
-                        aspect_ratio = img.width / img.height
-                        new_height = max_height
-                        new_width = int(new_height * aspect_ratio)
-
-                        img_resized = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
-
-                        # Save to buffer and encode
-                        buffer = io.BytesIO()
-                        img_resized.save(buffer, format='PNG', optimize=True)
-                        buffer.seek(0)
-
-                        logo_data = buffer.read()
-                        logo_b64 = base64.b64encode(logo_data).decode('utf-8')
-                        return f"data:image/png;base64,{logo_b64}"
-                    except ImportError:
-                        # PIL not available, use raw file
-                        with open(logo_path, 'rb') as f:
-                            logo_data = f.read()
-                            logo_b64 = base64.b64encode(logo_data).decode('utf-8')
-                            return f"data:image/png;base64,{logo_b64}"
-            except Exception:
+                key = (logo_path.resolve(), logo_path.stat().st_mtime_ns)
+            except OSError:
                 continue
+            cached = self._LOGO_CACHE.get(key)
+            if cached is None:
+                try:
+                    cached = self._LOGO_CACHE[key] = self._load_base64_logo(logo_path)
+                except Exception:
+                    continue
+            return cached
 
         # Fallback to a simple colored rectangle if no logo found
         # This ensures the activity log always works
         return "data:image/svg+xml;base64,PHN2ZyB3aWR0aD0iNDgiIGhlaWdodD0iNDgiIHhtbG5zPSJodHRwOi8vd3d3LnczLm9yZy8yMDAwL3N2ZyI+PHJlY3Qgd2lkdGg9IjQ4IiBoZWlnaHQ9IjQ4IiBmaWxsPSIjMkM1RjdEIi8+PC9zdmc+"
-    def _generate_html(self, data: dict) -> str:
+
+    def _load_base64_logo(self, logo_path: Path) -> str:
+        """Load, resize and encode the logo as a data URI."""
+        # Reuse the encoded logo from an earlier run if still current
+        cache_path = self.project_dir / ".xlsform-ai" / "logo.datauri"
+        try:
+            if cache_path.stat().st_mtime >= logo_path.stat().st_mtime:
+                return cache_path.read_text(encoding='utf-8')
+        except OSError:
+            pass
+
+        # Import PIL here to avoid dependency if not available
+        try:
+            Image = _get_pil_image()
+        except ImportError:
+            # PIL not available, use raw file
+            with open(logo_path, 'rb') as f:
+                logo_b64 = base64.b64encode(f.read()).decode('utf-8')
+            return f"data:image/png;base64,{logo_b64}"
+
+        img = Image.open(logo_path)
+
+        # Shrink in place to a reasonable header size (max height 96px)
+        img.thumbnail(LOGO_MAX_SIZE, Image.Resampling.LANCZOS)
+
+        # Save to buffer and encode; the result is cached, so skip extra compression
+        buffer = io.BytesIO()
+        img.save(buffer, format='PNG', optimize=False, compress_level=1)
+
+        logo_b64 = base64.b64encode(buffer.getvalue()).decode('utf-8')
+        data_uri = f"data:image/png;base64,{logo_b64}"
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            cache_path.write_text(data_uri, encoding='utf-8')
+        except OSError:
+            pass
+        return data_uri
+
+    def _iter_html(self, data: dict) -> Iterator[bytes]:
         """Generate modern, professional HTML for activity log.
 
         Features:
@@ -366,49 +820,58 @@ class ActivityLogger:
         Args:
             data: Log data dictionary
 
-        Returns:
-            HTML string
+        Yields:
+            UTF-8 encoded HTML fragments, in document order
         """
-        # Get logo as base64 data URI
-        logo_data_uri = self._get_base64_logo()
-
-        # Try to read the template file
-        template_path = Path(__file__).parent / 'activity_log_template.html'
-
-        # Fallback: use built-in template if file doesn't exist
-        if not template_path.exists():
-            return self._generate_html_fallback(data, logo_data_uri)
+        template = self._load_template(_scripts_dir / 'activity_log_template.html')
 
-        with open(template_path, 'r', encoding='utf-8') as f:
-            template = f.read()
-
-        # Embed the data
-        json_data = json.dumps(data, indent=2)
+        # Fallback: use built-in template if file doesn't exist; only this
+        # page embeds the logo, the template ships its own
+        if template is None:
+            yield from self._iter_html_fallback(data, self._get_base64_logo())
+            return
 
-        # Replace placeholders in template
-        html = template.replace('{DATA}', json_data)
+        # Embed the data between the pre-split template halves
+        head, tail = template
+        yield head
+        yield from _iter_payload(data)
+        yield tail
 
-        return html
+    @classmethod
+    def _load_template(cls, template_path: Path) -> Optional[Tuple[bytes, bytes]]:
+        """Read the HTML template once and split it at the {DATA} placeholder.
 
-    def _generate_html_fallback(self, data: dict, logo_data_uri: str) -> str:
+        Returns:
+            (head, tail) UTF-8 bytes, or None if the template file is missing
+        """
+        if template_path not in cls._TEMPLATE_CACHE:
+            try:
+                with open(template_path, 'rb') as f:
+                    head, _, tail = f.read().partition(b'{DATA}')
+                cls._TEMPLATE_CACHE[template_path] = (head, tail)
+            except FileNotFoundError:
+                cls._TEMPLATE_CACHE[template_path] = None
+        return cls._TEMPLATE_CACHE[template_path]
+
+    def _iter_html_fallback(self, data: dict, logo_data_uri: str) -> Iterator[bytes]:
         """Fallback HTML generation if template file is not found.
 
         Args:
             data: Log data dictionary
             logo_data_uri: Base64 encoded logo
 
-        Returns:
-            HTML string
+        Yields:
+            UTF-8 encoded HTML: the page head, one block per entry, then the payload
         """
         # This is a simplified version - in production, the template should always exist
-        entries = list(reversed(data.get("entries", [])))
-
-        return f"""<!DOCTYPE html>
+        project_name = str(data.get("project_name", "XLSForm")).translate(_HTML_ESCAPE)
+        yield f"""<!DOCTYPE html>
+<!-- {LOG_FILE_TAG} -->
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Activity Log - {data.get("project_name", "XLSForm")}</title>
+    <title>Activity Log - {project_name}</title>
     <style>
         body {{ font-family: -apple-system, sans-serif; line-height: 1.6; padding: 2rem; }}
         .entry {{ border: 1px solid #ddd; padding: 1rem; margin-bottom: 1rem; border-radius: 8px; }}
@@ -417,16 +880,24 @@ class ActivityLogger:
     </style>
 </head>
 <body>
-    <h1>Activity Log - {data.get("project_name", "XLSForm")}</h1>
+    <h1><img src="{logo_data_uri}" alt="Logo" height="48"> Activity Log - {project_name}</h1>
     <p><strong>Template file not found. Please ensure activity_log_template.html exists.</strong></p>
-    {"".join(f'<div class="entry"><span class="entry-type">{e.get("action_type", "")}</span><h3>{e.get("description", "")}</h3><div class="details">{e.get("details", "")}</div></div>' for e in entries)}
+    """.encode('utf-8')
+        for e in reversed(data.get("entries", [])):
+            action_type = str(e["action_type"]).translate(_HTML_ESCAPE)
+            description = str(e["description"]).translate(_HTML_ESCAPE)
+            details = str(e["details"]).translate(_HTML_ESCAPE)
+            yield f'<div class="entry"><span class="entry-type">{action_type}</span><h3>{description}</h3><div class="details">{details}</div></div>'.encode('utf-8')
+        yield """
     <div style="display:none;">
         <!-- XLSFORM_AI_DATA_START -->
-        {json.dumps(data, indent=2)}
+        """.encode('utf-8')
+        yield from _iter_payload(data)
+        yield """
         <!-- XLSFORM_AI_DATA_END -->
     </div>
 </body>
-</html>"""
+</html>""".encode('utf-8')
 
     def get_summary(self) -> dict:
         """Get summary of logged activities.
@@ -440,7 +911,7 @@ class ActivityLogger:
             "total_actions": data["total_actions"],
             "created": data["created"],
             "last_updated": data["last_updated"],
-            "recent_actions": list(reversed(data["entries"]))[-5:]  # Last 5 actions
+            "recent_actions": data["entries"][-5:][::-1]  # Last 5 actions, newest first
         }
 
 
@@ -458,6 +929,7 @@ if __name__ == "__main__":
 
     logger = ActivityLogger()
     log_file = logger.log_action(action_type, description, details, author, location)
+    logger.flush_html()
 
     print(f"Activity logged to: {log_file.name}")
     summary = logger.get_summary()
@@ -4,17 +4,46 @@ This module automatically detects "Other" choice options and creates
 "Other specify" follow-up questions with proper relevance logic.
 """
 
-from typing import List, Dict, Any, Optional
+import re
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 
 
-@dataclass
+@lru_cache(maxsize=8)
+def _keyword_pattern(keywords: Tuple[str, ...]) -> "re.Pattern[str]":
+    """Compile the 'Other' keywords into one case-insensitive alternation."""
+    return re.compile("|".join(re.escape(keyword) for keyword in keywords), re.IGNORECASE)
+
+
+@lru_cache(maxsize=512)
+def _other_choice_index(
+    choices_key: Tuple[Tuple[str, str], ...],
+    keywords: Tuple[str, ...],
+    other_code: str
+) -> int:
+    """Return the index of the first 'Other' choice, or -1 if there is none.
+
+    Cached on the (name, label) pairs so choice lists shared by several
+    select questions are only scanned once.
+    """
+    pattern = _keyword_pattern(keywords)
+    for index, (name, label) in enumerate(choices_key):
+        if pattern.search(label):
+            return index
+        if "other" in name.lower() or name == other_code:
+            return index
+    return -1
+
+
+@dataclass(slots=True)
 class Question:
     """Question information."""
     type: str
     name: str
     label: str
     choices: Optional[List[Dict[str, str]]] = None
+    relevance: Optional[str] = None
 
 
 class OtherSpecifyHandler:
@@ -78,20 +107,7 @@ class OtherSpecifyHandler:
         if not choices:
             return False
 
-        choice_labels = [choice.get("label", "").lower() for choice in choices]
-        choice_names = [choice.get("name", "").lower() for choice in choices]
-
-        # Check labels
-        for label in choice_labels:
-            if any(keyword in label for keyword in self.OTHER_KEYWORDS):
-                return True
-
-        # Check names
-        for name in choice_names:
-            if "other" in name or name == self.OTHER_CODE:
-                return True
-
-        return False
+        return self._find_other_index(choices) >= 0
 
     def find_other_choice(self, choices: List[Dict[str, str]]) -> Optional[Dict[str, str]]:
         """Find the 'Other' choice in the list.
@@ -105,19 +121,13 @@ class OtherSpecifyHandler:
         if not choices:
             return None
 
-        for choice in choices:
-            label = choice.get("label", "").lower()
-            name = choice.get("name", "")
+        index = self._find_other_index(choices)
+        return choices[index] if index >= 0 else None
 
-            # Check label
-            if any(keyword in label for keyword in self.OTHER_KEYWORDS):
-                return choice
-
-            # Check name
-            if "other" in name.lower() or name == self.OTHER_CODE:
-                return choice
-
-        return None
+    def _find_other_index(self, choices: List[Dict[str, str]]) -> int:
+        """Locate the 'Other' choice by label keyword or name, sharing one cached scan."""
+        choices_key = tuple((choice.get("name", ""), choice.get("label", "")) for choice in choices)
+        return _other_choice_index(choices_key, tuple(self.OTHER_KEYWORDS), self.OTHER_CODE)
 
     def create_other_specify_question(
         self,
@@ -151,7 +161,8 @@ class OtherSpecifyHandler:
             type="text",
             name=other_name,
             label=other_label,
-            choices=None
+            choices=None,
+            relevance=relevance
         )
 
     def process_question_with_other(
@@ -180,20 +191,18 @@ class OtherSpecifyHandler:
         """
         questions = [question]
 
-        if self.detect_other_choice(choices):
-            # Find the 'Other' choice
-            other_choice = self.find_other_choice(choices)
+        # Find the 'Other' choice (detection and lookup share one scan)
+        other_choice = self.find_other_choice(choices)
 
-            if other_choice:
-                # Get the choice name (default to 99 if not set)
-                other_choice_name = other_choice.get("name", self.OTHER_CODE)
+        if other_choice:
+            # Get the choice name (default to 99 if not set)
+            other_choice_name = other_choice.get("name", self.OTHER_CODE)
 
-                # Create other_specify follow-up
-                other_question = self.create_other_specify_question(
-                    question, other_choice_name
-                )
-                other_question.relevance = f"${{{question.name}}} = '{other_choice_name}'"
-                questions.append(other_question)
+            # Create other_specify follow-up
+            other_question = self.create_other_specify_question(
+                question, other_choice_name
+            )
+            questions.append(other_question)
 
         return questions
 
@@ -220,9 +229,9 @@ class OtherSpecifyHandler:
         # Check if "Other" already exists
         if self.detect_other_choice(choices):
             # Ensure it has code 99
+            pattern = _keyword_pattern(tuple(self.OTHER_KEYWORDS))
             for choice in choices:
-                label = choice.get("label", "").lower()
-                if any(keyword in label for keyword in self.OTHER_KEYWORDS):
+                if pattern.search(choice.get("label", "")):
                     if choice.get("name") != self.OTHER_CODE:
                         choice["name"] = self.OTHER_CODE
             return choices
@@ -22,6 +22,7 @@ import json
 import re
 import sys
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Iterable, List, Optional, Tuple
 
@@ -30,18 +31,13 @@ _scripts_dir = Path(__file__).parent.resolve()
 if str(_scripts_dir) not in sys.path:
     sys.path.insert(0, str(_scripts_dir))
 
-try:
-    from docx import Document as _Document
-    from docx.oxml.table import CT_Tbl
-    from docx.oxml.text.paragraph import CT_P
-    from docx.table import Table as _Table
-    from docx.text.paragraph import Paragraph as _Paragraph
-except ImportError:
-    _Document = None
-    CT_Tbl = None
-    CT_P = None
-    _Table = None
-    _Paragraph = None
+# python-docx (and lxml behind it) is imported on first use; see _load_docx()
+_Document = None
+CT_Tbl = None
+CT_P = None
+_Table = None
+_Paragraph = None
+_docx_import_attempted = False
 
 
 QUESTION_RE = re.compile(r"^\s*(?:Q(?:uestion)?\s*)?(\d+[A-Za-z]?)\s*[\.\):\-]\s*(.+)$")
@@ -50,26 +46,58 @@ QUESTION_WORD_RE = re.compile(
     r"^(who|what|when|where|why|how|which|do|does|did|is|are|was|were|can|could|will|would)\b"
 )
 SPLIT_OPTIONS_RE = re.compile(r"\s*[;\|\n]\s*")
+NON_ALNUM_RUN_RE = re.compile(r"[^a-z0-9]+")
+# ASCII bytes that may not appear in a choice value (everything but [a-z0-9_])
+NON_VALUE_BYTES = bytes(b for b in range(128) if not re.fullmatch(r"[a-z0-9_]", chr(b)))
+CHOICE_PREFIX_RE = re.compile(r"^\s*(?:\(?[A-Za-z]\)|[A-Za-z][\.\)]|\(?\d+\)?[\.\)\:\-=]?|[-*+])\s+")
+NUMBERED_OPTION_RE = re.compile(
+    r"(?:^|\s)\(?\d{1,2}\)?[\.\:\-=]?\s*([A-Za-z][A-Za-z/&\-\s]{1,60}?)(?=(?:\s+\(?\d{1,2}\)?[\.\:\-=]?\s+)|$)"
+)
+SHORT_NUMBER_RE = re.compile(r"\b\d{1,2}\b")
+SCALE_1_TO_5_RE = re.compile(r"\b1\s*[-to]{0,3}\s*5\b")
+SCALE_1_TO_4_RE = re.compile(r"\b1\s*[-to]{0,3}\s*4\b")
 HEADER_QUESTION_TOKENS = ("question", "item", "prompt", "label")
 HEADER_RESPONSE_TOKENS = ("response", "option", "choice", "answer")
 HEADER_VARIABLE_TOKENS = ("variable", "var", "name", "code")
 HEADER_TYPE_TOKENS = ("type", "question_type")
+OPTION_STOPWORDS = frozenset({"select one", "select all that apply", "response", "responses"})
+
+
+def _load_docx() -> bool:
+    """Import python-docx on first use and report whether it is available."""
+    global _Document, CT_Tbl, CT_P, _Table, _Paragraph, _docx_import_attempted
+    if not _docx_import_attempted:
+        _docx_import_attempted = True
+        try:
+            from docx import Document
+            from docx.oxml.table import CT_Tbl as tbl_cls
+            from docx.oxml.text.paragraph import CT_P as p_cls
+            from docx.table import Table
+            from docx.text.paragraph import Paragraph
+        except ImportError:
+            return False
+        CT_Tbl, CT_P, _Table, _Paragraph = tbl_cls, p_cls, Table, Paragraph
+        _Document = Document
+    return _Document is not None
 
 
+# Cell and paragraph text repeats heavily across rows (headers, blanks, "Response")
+@lru_cache(maxsize=4096)
 def _clean_text(value: str) -> str:
-    return re.sub(r"\s+", " ", value or "").strip()
+    return " ".join((value or "").split())
 
 
+@lru_cache(maxsize=4096)
 def _choice_value(label: str) -> str:
-    value = re.sub(r"\s+", "_", label.strip().lower())
-    value = re.sub(r"[^a-z0-9_]", "", value)
+    # Whitespace runs become "_"; non-ASCII and other disallowed characters are dropped
+    value = "_".join(label.lower().split())
+    value = value.encode("ascii", "ignore").translate(None, NON_VALUE_BYTES).decode("ascii")
     return value[:48] or "option"
 
 
 def _normalize_variable_name(raw_value: str) -> str:
     text = _clean_text(raw_value).lower()
-    text = re.sub(r"[^a-z0-9_]", "_", text)
-    text = re.sub(r"_+", "_", text).strip("_")
+    text = NON_ALNUM_RUN_RE.sub("_", text).strip("_")
     if not text:
         return ""
     if text[0].isdigit():
@@ -80,13 +108,7 @@ def _normalize_variable_name(raw_value: str) -> str:
 
 
 def _strip_choice_prefix(text: str) -> str:
-    return _clean_text(
-        re.sub(
-            r"^\s*(?:\(?[A-Za-z]\)|[A-Za-z][\.\)]|\(?\d+\)?[\.\)\:\-=]?|[-*+])\s+",
-            "",
-            text,
-        )
-    )
+    return _clean_text(CHOICE_PREFIX_RE.sub("", text, count=1))
 
 
 def _looks_like_question(text: str) -> bool:
@@ -122,11 +144,8 @@ def _infer_select_mode(question_text: str, response_hint: str = "") -> str:
 
 def _extract_numbered_inline_options(raw_text: str) -> List[str]:
     # Handles patterns like: "1 Always 2 Often 3 Sometimes 4 Rarely 5 Never"
-    matches = re.findall(
-        r"(?:^|\s)\(?\d{1,2}\)?[\.\:\-=]?\s*([A-Za-z][A-Za-z/&\-\s]{1,60}?)(?=(?:\s+\(?\d{1,2}\)?[\.\:\-=]?\s+)|$)",
-        raw_text,
-    )
-    cleaned = [_clean_text(m) for m in matches if _clean_text(m)]
+    matches = NUMBERED_OPTION_RE.findall(raw_text)
+    cleaned = [text for text in map(_clean_text, matches) if text]
     # Require at least two options to avoid false positives.
     return cleaned if len(cleaned) >= 2 else []
 
@@ -174,7 +193,7 @@ def _infer_standard_scale_options(question_text: str, response_hint: str = "") -
         return confidence_scale
 
     # Heuristic mapping for common 4/5-point scales when only numeric hints exist.
-    if re.search(r"\b1\s*[-to]{0,3}\s*5\b", combined) and any(
+    if SCALE_1_TO_5_RE.search(combined) and any(
         token in combined for token in ["agree", "satisfied", "often", "frequency", "rate"]
     ):
         if "agree" in combined:
@@ -183,7 +202,7 @@ def _infer_standard_scale_options(question_text: str, response_hint: str = "") -
             return satisfaction_scale
         return frequency_scale
 
-    if re.search(r"\b1\s*[-to]{0,3}\s*4\b", combined) and any(
+    if SCALE_1_TO_4_RE.search(combined) and any(
         token in combined for token in ["confident", "often", "frequency", "rate"]
     ):
         if "confident" in combined:
@@ -246,33 +265,32 @@ def _parse_option_blob(raw_text: str) -> List[str]:
     if "yes/no" in lowered or "yes / no" in lowered:
         return ["Yes", "No"]
 
-    tokens: List[str] = []
+    # Pick one splitter by precedence; every branch yields already-cleaned text
     if "\n" in raw_text:
-        tokens = [_strip_choice_prefix(piece) for piece in raw_text.splitlines() if _clean_text(piece)]
+        tokens = map(_strip_choice_prefix, raw_text.splitlines())
     elif ";" in text or "|" in text:
-        tokens = [_strip_choice_prefix(piece) for piece in SPLIT_OPTIONS_RE.split(raw_text) if _clean_text(piece)]
+        tokens = map(_strip_choice_prefix, SPLIT_OPTIONS_RE.split(raw_text))
     elif text.count(",") >= 2:
-        tokens = [_strip_choice_prefix(piece) for piece in raw_text.split(",") if _clean_text(piece)]
-    elif re.search(r"\b\d{1,2}\b", text):
+        tokens = map(_strip_choice_prefix, raw_text.split(","))
+    elif SHORT_NUMBER_RE.search(text):
         tokens = _extract_numbered_inline_options(raw_text)
     elif CHOICE_RE.match(text):
         tokens = [_strip_choice_prefix(text)]
+    else:
+        return []
 
-    cleaned: List[str] = []
-    for token in tokens:
-        candidate = _clean_text(token)
-        if not candidate:
-            continue
-        if candidate.lower() in {"select one", "select all that apply", "response", "responses"}:
-            continue
-        cleaned.append(candidate)
-    return cleaned
+    return [token for token in tokens if token and token.lower() not in OPTION_STOPWORDS]
+
+
+@lru_cache(maxsize=None)
+def _header_token_pattern(tokens: Tuple[str, ...]) -> "re.Pattern[str]":
+    return re.compile("|".join(map(re.escape, tokens)))
 
 
 def _detect_header_index(row: List[str], tokens: Tuple[str, ...]) -> Optional[int]:
+    search = _header_token_pattern(tokens).search
     for idx, value in enumerate(row):
-        lowered = value.lower()
-        if any(token in lowered for token in tokens):
+        if search(value.lower()):
             return idx
     return None
 
@@ -389,12 +407,14 @@ def _iter_doc_blocks(doc) -> Iterable[Tuple[str, object]]:
     if CT_P is None or CT_Tbl is None or _Paragraph is None or _Table is None:
         return []
 
+    # python-docx maps w:p and w:tbl to exactly these element classes
+    dispatch = {CT_P: ("paragraph", _Paragraph), CT_Tbl: ("table", _Table)}
     body = doc.element.body
     for child in body.iterchildren():
-        if isinstance(child, CT_P):
-            yield "paragraph", _Paragraph(child, doc)
-        elif isinstance(child, CT_Tbl):
-            yield "table", _Table(child, doc)
+        entry = dispatch.get(type(child))
+        if entry is not None:
+            kind, wrapper = entry
+            yield kind, wrapper(child, doc)
 
 
 def _build_media_context(
@@ -428,7 +448,7 @@ def extract_questions_from_docx(
     auto_scale: bool = False,
 ) -> List[Dict[str, object]]:
     """Extract a list of question objects from a Word document."""
-    if _Document is None:
+    if not _load_docx():
         raise RuntimeError("python-docx is required. Install with: pip install python-docx")
 
     source_path = Path(docx_path).resolve()
@@ -637,7 +657,7 @@ def extract_questions_from_docx(
         type_col = None
 
         for idx, row in enumerate(rows[:3]):
-            cells = [str(item) for item in row["texts"]]
+            cells = row["texts"]
             maybe_question_col = _detect_header_index(cells, HEADER_QUESTION_TOKENS)
             if maybe_question_col is None:
                 continue
@@ -657,7 +677,8 @@ def extract_questions_from_docx(
             texts = row["texts"]
             images = row["images"]
 
-            if all(not _clean_text(str(text)) for text in texts) and all(not img for img in images):
+            # Cell texts were cleaned when the rows were collected
+            if not any(texts) and not any(images):
                 continue
 
             question_text = texts[question_col] if question_col < len(texts) else ""
@@ -666,7 +687,7 @@ def extract_questions_from_docx(
             response_images = images[response_col] if response_col is not None and response_col < len(images) else []
             variable_name = texts[variable_col] if variable_col is not None and variable_col < len(texts) else ""
             explicit_type = texts[type_col] if type_col is not None and type_col < len(texts) else ""
-            if _clean_text(response_text):
+            if response_text:
                 active_response_template = response_text
 
             if question_text:
@@ -736,7 +757,7 @@ def extract_questions_from_docx(
             for row in block.rows:
                 for cell in row.cells:
                     cell_images = _extract_cell_media_refs(cell, media_context)
-                    cell_lines = [_clean_text(part) for part in cell.text.splitlines() if _clean_text(part)]
+                    cell_lines = [line for line in map(_clean_text, cell.text.splitlines()) if line]
                     if not cell_lines:
                         if cell_images and current_question is not None and "media::image" not in current_question:
                             current_question["media::image"] = cell_images[0]
@@ -840,7 +861,7 @@ def main() -> None:
         print(f"Error: File not found: {source_path}")
         sys.exit(1)
 
-    if _Document is None:
+    if not _load_docx():
         print("Error: python-docx is required. Install with: pip install python-docx")
         sys.exit(1)
 